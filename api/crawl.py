@@ -1,15 +1,21 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import requests
-import json
 import time
 import urllib3
-import openpyxl # Although not used for direct Excel saving in API, it's a dependency for the original script's logic.
+import os
+import sys
 
 # Suppress InsecureRequestWarning when using verify=False
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# 루트의 공용 모듈(fastjson) 사용
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastjson import FastJSONProvider, load_response
+from http_cache import MemoCache, memoized_json, no_store
+
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 CORS(app)
 
 # 프록시 설정 (Vercel 환경에서는 필요 없을 수 있으나, 원본 코드에 있었으므로 유지)
@@ -26,6 +32,10 @@ TRADE_TYPE_MAPPING = {
     "월세": "B2"
 }
 
+# 함수 인스턴스가 warm 상태인 동안 같은 검색·수집 결과를 재사용 (CDN 캐시 앞단)
+region_cache = MemoCache()
+real_estate_cache = MemoCache()
+
 # ------------------------ 데이터 수집 관련 함수 (GUI 독립 버전) ------------------------ #
 def get_complexes_by_region_api(keyword):
     try:
@@ -65,7 +75,7 @@ def get_complexes_by_region_api(keyword):
         response = session.get(url, params=params, timeout=30, verify=False)
         response.raise_for_status()
         print(f"지역 검색 API 응답 성공: 상태 코드 {response.status_code}")
-        complexes = response.json().get('complexes', [])
+        complexes = load_response(response).get('complexes', [])
         complexes.sort(key=lambda x: x['complexName'])
         return complexes
     except requests.exceptions.RequestException as e:
@@ -138,7 +148,7 @@ def get_real_estate_data_api(complex_no, trade_type, page=1):
         print(f"[DEBUG] API 요청 시작: {url} with params={params}")
         response = session.get(url, params=params, timeout=30, verify=False)
         response.raise_for_status()
-        data = response.json()
+        data = load_response(response)
         print(f"[DEBUG] API 응답 성공: 상태 코드 {response.status_code}")
         return data
     except requests.exceptions.RequestException as e:
@@ -197,40 +207,47 @@ def fetch_all_pages_api(complex_no, trade_type):
 # ------------------------ API 엔드포인트 ------------------------ #
 @app.route('/api/search_region', methods=['GET'])
 def search_region_endpoint():
-    keyword = request.args.get('keyword')
+    keyword = (request.args.get('keyword') or '').strip()
     if not keyword:
-        return jsonify({"error": "Keyword is required"}), 400
-    try:
+        return no_store(jsonify({"error": "Keyword is required"}), 400)
+
+    def produce():
         complexes = get_complexes_by_region_api(keyword)
         if not complexes:
-            return jsonify({"message": "No complexes found for the given keyword"}), 200
-        return jsonify(complexes), 200
+            return {"message": "No complexes found for the given keyword"}
+        return complexes
+
+    try:
+        return memoized_json(region_cache, keyword, produce)
     except requests.exceptions.RequestException as e:
-        return jsonify({"error": f"Failed to fetch data from Naver: {str(e)}"}), 500
+        return no_store(jsonify({"error": f"Failed to fetch data from Naver: {str(e)}"}), 500)
     except Exception as e:
-        return jsonify({"error": f"An unexpected error occurred: {str(e)}"}), 500
+        return no_store(jsonify({"error": f"An unexpected error occurred: {str(e)}"}), 500)
 
 @app.route('/api/get_real_estate_data', methods=['GET'])
 def get_real_estate_data_endpoint():
-    complex_no = request.args.get('complex_no')
+    complex_no = (request.args.get('complex_no') or '').strip()
     trade_type_display = request.args.get('trade_type')
 
     if not complex_no or not trade_type_display:
-        return jsonify({"error": "complex_no and trade_type are required"}), 400
+        return no_store(jsonify({"error": "complex_no and trade_type are required"}), 400)
 
     trade_type = TRADE_TYPE_MAPPING.get(trade_type_display)
     if trade_type is None:
-        return jsonify({"error": "Invalid trade_type"}), 400
+        return no_store(jsonify({"error": "Invalid trade_type"}), 400)
 
-    try:
+    def produce():
         all_data = fetch_all_pages_api(complex_no, trade_type)
         if not all_data:
-            return jsonify({"message": "No real estate data found for the given criteria"}), 200
-        return jsonify(all_data), 200
+            return {"message": "No real estate data found for the given criteria"}
+        return all_data
+
+    try:
+        return memoized_json(real_estate_cache, (complex_no, trade_type), produce)
     except requests.exceptions.RequestException as e:
-        return jsonify({"error": f"Failed to fetch data from Naver: {str(e)}"}), 500
+        return no_store(jsonify({"error": f"Failed to fetch data from Naver: {str(e)}"}), 500)
     except Exception as e:
-        return jsonify({"error": f"An unexpected error occurred: {str(e)}"}), 500
+        return no_store(jsonify({"error": f"An unexpected error occurred: {str(e)}"}), 500)
 
 @app.route('/')
 def home():
@@ -0,0 +1,242 @@
+"""ASGI 서빙 모드 (비동기 수집)
+
+/search, /fetch_data, /download_excel은 이벤트 루프에서 직접 처리하고, 네이버 요청은
+naver_async의 공유 커넥션 풀로 보낸다. 업스트림 응답이나 페이지 사이 대기 중에도 워커가 묶이지
+않으므로 프로세스 하나가 수백 건의 수집을 동시에 처리할 수 있다. 그 밖의 경로는 기존 Flask 앱을
+스레드 풀에서 WSGI로 실행한다.
+
+비동기 경로도 Flask 요청 컨텍스트 안에서 before/after_request 훅(CSRF, 로그인, 압축)과 app.py의
+요청 검사·응답 생성 함수를 그대로 사용하므로 JSON 형식은 동기 모드와 같다. 클라이언트 연결이
+끊기면 진행 중인 수집을 취소하고, CRAWL_TIMEOUT을 넘기면 504로 응답한다.
+
+    uvicorn asgi:app --workers 2
+    gunicorn asgi:app -k uvicorn.workers.UvicornWorker
+"""
+import asyncio
+import io
+import os
+
+from a2wsgi import WSGIMiddleware
+from a2wsgi.wsgi import build_environ
+from flask import jsonify
+from flask_login import current_user
+
+import naver_async
+from app import (app as flask_app, login_manager, TRADE_TYPE_MAPPING, search_keyword, search_response,
+                 fetch_data_options, fetch_data_response, download_options, filter_export_articles,
+                 download_response, build_export_file)
+
+CRAWL_TIMEOUT = float(os.environ.get('CRAWL_TIMEOUT', 120))  # 요청 하나의 업스트림 수집 제한 시간(초)
+WSGI_WORKERS = int(os.environ.get('WSGI_WORKERS', 10))  # 동기 경로를 실행할 스레드 수
+
+wsgi_app = WSGIMiddleware(flask_app, workers=WSGI_WORKERS)
+
+
+class ClientDisconnected(Exception):
+    """응답 전에 클라이언트 연결이 끊김"""
+
+
+async def read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            raise ClientDisconnected()
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+async def upstream(receive, coro):
+    """업스트림 수집 coro 실행
+
+    클라이언트 연결이 끊기면 수집을 취소하고 ClientDisconnected를, CRAWL_TIMEOUT을 넘기면
+    asyncio.TimeoutError를 발생시킨다.
+    """
+    async def watch_disconnect():
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+
+    crawl = asyncio.ensure_future(asyncio.wait_for(coro, CRAWL_TIMEOUT))
+    watcher = asyncio.ensure_future(watch_disconnect())
+    try:
+        await asyncio.wait({crawl, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        crawl.cancel()
+        raise
+    finally:
+        watcher.cancel()
+    if not crawl.done():
+        crawl.cancel()
+        raise ClientDisconnected()
+    return crawl.result()
+
+
+# ------------------------ 비동기 경로 ------------------------ #
+# 동기 view와 같은 응답을 반환한다. 수집 취소·시간 초과는 dispatch에서 처리한다.
+PASSTHROUGH_ERRORS = (ClientDisconnected, asyncio.TimeoutError)
+
+
+async def search(receive):
+    """아파트 단지 검색 API (app.search의 비동기 버전)"""
+    if not current_user.is_authenticated:
+        return login_manager.unauthorized()
+    try:
+        keyword, error = search_keyword()
+        if error:
+            return error
+
+        print(f"[DEBUG] Searching for keyword: {keyword}")
+        return search_response(keyword, await upstream(receive, naver_async.get_complexes_by_region(keyword)))
+
+    except PASSTHROUGH_ERRORS:
+        raise
+    except Exception as e:
+        print(f"[ERROR] Unexpected error: {str(e)}")
+        return jsonify({'error': f'검색 중 오류가 발생했습니다: {str(e)}'}), 500
+
+
+async def fetch_data(receive):
+    """매물 데이터 조회 API (app.fetch_data의 비동기 버전)"""
+    if not current_user.is_authenticated:
+        return login_manager.unauthorized()
+    try:
+        options, error = fetch_data_options()
+        if error:
+            return error
+
+        complex_info = await upstream(receive, naver_async.get_complex_info(options['complex_no']))
+        if not complex_info:
+            return jsonify({'error': '단지 정보를 찾을 수 없습니다.'}), 404
+
+        article_list = await upstream(receive, naver_async.get_article_list(options['complex_no'],
+                                                                             options['trade_type_code']))
+        if not article_list:
+            return jsonify({'error': '매물 정보를 찾을 수 없습니다.'}), 404
+
+        return fetch_data_response(options, complex_info, article_list)
+
+    except PASSTHROUGH_ERRORS:
+        raise
+    except Exception as e:
+        print(f"[ERROR] Error in fetch_data: {str(e)}")
+        return jsonify({'error': f'데이터 조회 중 오류가 발생했습니다: {str(e)}'}), 500
+
+
+async def download_excel(receive):
+    """매물 파일 내보내기 API (app.download_excel의 비동기 버전)"""
+    try:
+        options, error = download_options()
+        if error:
+            return error
+
+        complex_no, trade_type, export_format = options
+        complex_info = await upstream(receive, naver_async.get_complex_info(complex_no))
+        if not complex_info:
+            return jsonify({'error': '단지 정보를 찾을 수 없습니다.'}), 404
+
+        article_list = await upstream(receive, naver_async.get_article_list(
+            complex_no, TRADE_TYPE_MAPPING.get(trade_type, '')))
+        complex_info, filtered_articles, error, status = filter_export_articles(complex_info, article_list,
+                                                                                trade_type)
+        if error:
+            return jsonify({'error': error}), status
+
+        if export_format != 'csv':
+            # 엑셀/Parquet 생성은 스레드에서 미리 해 두고 응답은 내보내기 캐시의 파일로 만든다
+            complex_name = complex_info.get('complexName', '매물정보')
+            try:
+                await asyncio.to_thread(build_export_file, complex_name, trade_type, filtered_articles,
+                                        export_format)
+            except ImportError:
+                pass  # download_response가 501로 응답
+        return download_response(complex_info, trade_type, filtered_articles, export_format)
+
+    except PASSTHROUGH_ERRORS:
+        raise
+    except Exception as e:
+        print(f"Excel download error: {str(e)}")
+        return jsonify({'error': '엑셀 파일 생성 중 오류가 발생했습니다.'}), 500
+
+
+ASYNC_ROUTES = {
+    ('POST', '/search'): search,
+    ('POST', '/fetch_data'): fetch_data,
+    ('POST', '/download_excel'): download_excel,
+}
+
+
+# ------------------------ ASGI 처리 ------------------------ #
+async def dispatch(view, environ, receive):
+    """Flask 요청 컨텍스트 안에서 비동기 view 실행 (Flask.full_dispatch_request와 같은 순서)
+
+    반환값: Flask 응답 객체 (클라이언트 연결이 끊겼으면 None)
+    """
+    ctx = flask_app.request_context(environ)
+    error = None
+    ctx.push()
+    try:
+        try:
+            rv = flask_app.preprocess_request()
+            if rv is None:
+                rv = await view(receive)
+        except ClientDisconnected:
+            print(f"[DEBUG] 클라이언트 연결 종료로 수집 취소: {environ['PATH_INFO']}")
+            return None
+        except asyncio.TimeoutError:
+            print(f"[ERROR] 수집 시간 초과 ({CRAWL_TIMEOUT:g}초): {environ['PATH_INFO']}")
+            rv = jsonify({'error': '수집 시간이 초과되었습니다.'}), 504
+        except Exception as e:
+            rv = flask_app.handle_user_exception(e)
+        return flask_app.finalize_request(rv)
+    except Exception as e:
+        error = e
+        return flask_app.handle_exception(e)
+    finally:
+        ctx.pop(error)
+
+
+async def send_response(response, send):
+    headers = [(name.lower().encode('latin1'), value.encode('latin1')) for name, value in response.headers.items()]
+    await send({'type': 'http.response.start', 'status': response.status_code, 'headers': headers})
+    try:
+        if not response.is_streamed:
+            await send({'type': 'http.response.body', 'body': response.get_data()})
+            return
+        # CSV 스트림·파일 전송은 조각마다 이벤트 루프에 양보하며 보낸다
+        for chunk in response.iter_encoded():
+            if chunk:
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        response.close()
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await naver_async.aclose()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+
+    view = ASYNC_ROUTES.get((scope.get('method'), scope.get('path'))) if scope['type'] == 'http' else None
+    if view is None:
+        await wsgi_app(scope, receive, send)
+        return
+
+    try:
+        body = await read_body(receive)
+    except ClientDisconnected:
+        return
+    response = await dispatch(view, build_environ(scope, io.BytesIO(body)), receive)
+    if response is not None:
+        await send_response(response, send)
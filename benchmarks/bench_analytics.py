@@ -0,0 +1,39 @@
+"""가격 분석 집계 벤치마크
+
+네이버 articleList 형태의 매물(기본 50,000건)을 DataFrame으로 변환(가격·면적 파싱 포함)하고
+거래유형 x 면적대별 통계를 집계하는 시간을 측정한다.
+
+    python benchmarks/bench_analytics.py [매물 수]
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics  # noqa: E402
+from bench_json import make_article  # noqa: E402
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f'  {label:<28} {seconds * 1000:8.2f} ms')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    random.seed(0)
+    articles = [make_article(i) for i in range(count)]
+    frame = analytics.frame_from_articles(articles)
+
+    print(f'listings: {count}')
+    bench('frame_from_articles', lambda: analytics.frame_from_articles(articles), 5)
+    bench('frame_key', lambda: analytics.frame_key(frame), 5)
+    bench('aggregate', lambda: analytics.aggregate(frame), 5)
+    analytics.summarize(frame)
+    bench('summarize (cached)', lambda: analytics.summarize(frame), 5)
+
+
+if __name__ == '__main__':
+    main()
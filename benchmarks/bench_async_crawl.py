@@ -0,0 +1,191 @@
+"""동기(gunicorn sync) / 비동기(ASGI) 서빙 모드의 동시 수집 처리량 비교
+
+네이버 API를 흉내 내는 목(mock) 업스트림을 띄우고, 두 서빙 모드를 각각 프로세스 1개로 실행한 뒤
+로그인한 세션으로 /fetch_data 요청을 동시에 보내 처리 시간과 처리량을 측정한다.
+목 업스트림은 요청마다 UPSTREAM_LATENCY만큼 지연하고, 단지마다 PAGES 페이지의 매물을 돌려준다.
+
+    pip install aiohttp uvicorn a2wsgi
+    python benchmarks/bench_async_crawl.py [비동기 동시 요청 수] [동기 동시 요청 수]
+"""
+import asyncio
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import aiohttp
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+UPSTREAM_LATENCY = 0.05  # 목 업스트림 응답 지연(초)
+PAGES = 3  # 단지당 매물 목록 페이지 수
+ARTICLES_PER_PAGE = 20
+PAGE_DELAY = 0.5  # NAVER_PAGE_DELAY
+ADMIN_EMAIL = 'admin@example.com'
+ADMIN_PASSWORD = 'deok3094'
+
+
+# ------------------------ 목 업스트림 ------------------------ #
+def mock_article(complex_no, page, index):
+    return {
+        'articleNo': f'{complex_no}{page:02d}{index:03d}',
+        'articleName': f'테스트단지{complex_no}',
+        'tradeTypeName': ('매매', '전세', '월세')[index % 3],
+        'floorInfo': f'{index % 20 + 1}/25',
+        'dealOrWarrantPrc': f'{10 + index % 5}억 {index * 100:,}',
+        'rentPrc': '100' if index % 3 == 2 else None,
+        'area2': str(59 + index % 4 * 25),
+        'direction': '남향',
+        'articleConfirmYmd': f'202501{index % 28 + 1:02d}',
+        'buildingName': f'{100 + index % 10}동',
+        'realtorName': f'중개사{index % 7}',
+        'tagList': ['역세권'],
+    }
+
+
+async def mock_upstream(scope, receive, send):
+    if scope['type'] != 'http':
+        return
+    from fastjson import dumps_bytes
+
+    await asyncio.sleep(UPSTREAM_LATENCY)
+    path = scope['path']
+    query = dict(part.split('=', 1) for part in scope['query_string'].decode().split('&') if '=' in part)
+    if path.startswith('/api/search'):
+        body = {'complexes': [{'complexNo': str(no), 'complexName': f'테스트단지{no}'} for no in range(1, 6)]}
+    elif path.startswith('/api/complexes/overview/'):
+        complex_no = path.rsplit('/', 1)[-1]
+        body = {'complexNo': complex_no, 'complexName': f'테스트단지{complex_no}'}
+    elif path.startswith('/api/articles/complex/'):
+        complex_no = path.rsplit('/', 1)[-1]
+        page = int(query.get('page', 1))
+        body = {
+            'isMoreData': page < PAGES,
+            'articleList': [mock_article(complex_no, page, index) for index in range(ARTICLES_PER_PAGE)],
+        }
+    else:
+        body = None
+
+    content = b'<html></html>' if body is None else dumps_bytes(body)
+    content_type = b'text/html' if body is None else b'application/json'
+    await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', content_type)]})
+    await send({'type': 'http.response.body', 'body': content})
+
+
+def run_mock_upstream(port):
+    import uvicorn
+
+    sys.path.insert(0, ROOT)
+    uvicorn.run(mock_upstream, host='127.0.0.1', port=port, log_level='warning', backlog=4096)
+
+
+# ------------------------ 측정 ------------------------ #
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f'port {port} did not open')
+
+
+async def login(session, base_url):
+    """관리자로 로그인하고 JSON 요청용 CSRF 토큰을 반환"""
+    async with session.get(f'{base_url}/login') as page:
+        token = re.search(r'name="csrf_token" type="hidden" value="([^"]+)"', await page.text()).group(1)
+    form = {'csrf_token': token, 'email': ADMIN_EMAIL, 'password': ADMIN_PASSWORD}
+    async with session.post(f'{base_url}/login', data=form) as response:
+        await response.read()
+    async with session.get(f'{base_url}/dashboard') as dashboard:
+        return re.search(r"'X-CSRFToken': '([^']+)'", await dashboard.text()).group(1)
+
+
+async def crawl_burst(port, concurrency):
+    base_url = f'http://127.0.0.1:{port}'
+    # 127.0.0.1에 대한 세션 쿠키를 저장하려면 unsafe 쿠키 저장소가 필요
+    async with aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar(unsafe=True),
+                                     connector=aiohttp.TCPConnector(limit=0)) as session:
+        csrf_token = await login(session, base_url)
+
+        async def one(complex_no):
+            started = time.perf_counter()
+            async with session.post(f'{base_url}/fetch_data', headers={'X-CSRFToken': csrf_token},
+                                    json={'complex_no': str(complex_no), 'trade_type': '전체'}) as response:
+                ok = response.status == 200 and (await response.json())['raw_count'] == PAGES * ARTICLES_PER_PAGE
+            return ok, time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(one(1000 + index) for index in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for _, latency in results)
+    return {
+        'ok': sum(ok for ok, _ in results),
+        'elapsed': elapsed,
+        'p50': latencies[len(latencies) // 2],
+        'p95': latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+def run_mode(name, command, concurrency, env):
+    port = free_port()
+    server = subprocess.Popen([part.format(port=port) for part in command], cwd=ROOT, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(port)
+        result = asyncio.run(crawl_burst(port, concurrency))
+    finally:
+        server.terminate()
+        server.wait()
+    print(f"[{name}] 동시 {concurrency}건: 성공 {result['ok']}건, {result['elapsed']:.2f}s, "
+          f"{result['ok'] / result['elapsed']:.1f} crawls/s, p50 {result['p50']:.2f}s, p95 {result['p95']:.2f}s")
+    return result
+
+
+def main():
+    async_concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    sync_concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    mock_port = free_port()
+    mock = subprocess.Popen([sys.executable, __file__, '--mock-upstream', str(mock_port)])
+    workdir = tempfile.mkdtemp(prefix='bench_async_crawl_')
+    env = dict(os.environ,
+               DATABASE_URL=f'sqlite:///{os.path.join(workdir, "bench.db")}',
+               DB_PROFILE='production',
+               EXPIRY_SWEEPER_ENABLED='0',
+               NAVER_BASE_URL=f'http://127.0.0.1:{mock_port}',
+               NAVER_PAGE_DELAY=str(PAGE_DELAY),
+               EXPORT_CACHE_DIR=os.path.join(workdir, 'exports'))
+    try:
+        wait_for_port(mock_port)
+        subprocess.run([sys.executable, '-c', 'from app import init_db; init_db()'], cwd=ROOT, env=env,
+                       check=True, stdout=subprocess.DEVNULL)
+        requests_per_crawl = 3 + PAGES
+        print(f"목 업스트림: 요청당 {UPSTREAM_LATENCY * 1000:.0f} ms, 수집 1건 = 요청 {requests_per_crawl}회 + "
+              f"페이지 대기 {PAGES - 1}회 x {PAGE_DELAY}s")
+
+        run_mode('sync  gunicorn -w 1', [sys.executable, '-m', 'gunicorn', '-w', '1', '-b', '127.0.0.1:{port}',
+                                        'wsgi:app'], sync_concurrency, env)
+        run_mode('async uvicorn asgi ', [sys.executable, '-m', 'uvicorn', 'asgi:app', '--port', '{port}',
+                                        '--log-level', 'warning', '--backlog', '4096'], async_concurrency, env)
+    finally:
+        mock.terminate()
+        mock.wait()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--mock-upstream':
+        run_mock_upstream(int(sys.argv[2]))
+    else:
+        main()
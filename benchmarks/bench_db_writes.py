@@ -0,0 +1,86 @@
+"""SQLite 동시 쓰기 벤치마크 (default vs production 프로파일)
+
+gunicorn 워커처럼 여러 프로세스가 같은 SQLite 파일에 짧은 쓰기 트랜잭션
+(로그인 시 last_login 갱신 + 검색 기록 INSERT)을 동시에 실행하고,
+초당 커밋 수와 잠금 오류 수를 프로파일별로 비교한다.
+
+    python benchmarks/bench_db_writes.py [프로세스 수] [프로세스당 트랜잭션 수]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+import database  # noqa: E402
+
+USERS = 100
+
+
+def make_engine(url, profile):
+    engine = create_engine(url, **database.engine_options(url, profile))
+    if profile == 'production':
+        event.listen(engine, 'connect', database.set_sqlite_pragmas)
+    return engine
+
+
+def setup(url):
+    engine = create_engine(url)
+    with engine.begin() as connection:
+        connection.execute(text('CREATE TABLE user (id INTEGER PRIMARY KEY, last_login DATETIME)'))
+        connection.execute(text('CREATE TABLE search (id INTEGER PRIMARY KEY, user_id INTEGER, keyword TEXT, created_at DATETIME)'))
+        connection.execute(text('INSERT INTO user (id) VALUES (:id)'), [{'id': i} for i in range(1, USERS + 1)])
+    engine.dispose()
+
+
+def worker(args):
+    url, profile, worker_id, count = args
+    engine = make_engine(url, profile)
+    engine.connect().close()  # 연결/PRAGMA 비용은 측정에서 제외
+    committed = errors = 0
+    started = time.time()
+    for i in range(count):
+        user_id = (worker_id * count + i) % USERS + 1
+        try:
+            with engine.begin() as connection:
+                now = datetime.utcnow()
+                connection.execute(text('UPDATE user SET last_login = :now WHERE id = :id'), {'now': now, 'id': user_id})
+                connection.execute(text('INSERT INTO search (user_id, keyword, created_at) VALUES (:id, :keyword, :now)'),
+                                   {'id': user_id, 'keyword': f'단지{i}', 'now': now})
+            committed += 1
+        except OperationalError:
+            errors += 1  # database is locked
+    finished = time.time()
+    engine.dispose()
+    return committed, errors, started, finished
+
+
+def run(profile, processes, count):
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        setup(url)
+        with multiprocessing.get_context('spawn').Pool(processes) as pool:
+            results = pool.map(worker, [(url, profile, worker_id, count) for worker_id in range(processes)])
+    # 프로세스 시작 시간을 빼고 쓰기 구간(가장 이른 시작 ~ 가장 늦은 종료)만 측정
+    elapsed = max(result[3] for result in results) - min(result[2] for result in results)
+    committed = sum(result[0] for result in results)
+    errors = sum(result[1] for result in results)
+    print(f'  {profile:<11} {committed / elapsed:9.0f} commits/s  ({committed} ok, {errors} locked, {elapsed:.2f}s)')
+
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    print(f'processes: {processes}, transactions per process: {count}')
+    for profile in ('default', 'production'):
+        run(profile, processes, count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""JSON 직렬화 마이크로 벤치마크
+
+실제 응답 형태(5,000건 매물 행 목록 / 컬럼형 응답 / 네이버 articleList 원본)로
+표준 json과 fastjson(orjson 사용 시)의 직렬화·역직렬화 시간을 비교한다.
+
+    python benchmarks/bench_json.py [매물 수]
+"""
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fastjson  # noqa: E402
+from listings import to_columnar  # noqa: E402
+
+TRADE_TYPES = ['매매', '전세', '월세']
+DIRECTIONS = ['남향', '동향', '서향', '남동향', '남서향']
+REALTORS = [f'{name}공인중개사사무소' for name in ('한빛', '미래', '으뜸', '우리', '대박', '행복')]
+
+
+def make_article(index):
+    trade_type = random.choice(TRADE_TYPES)
+    return {
+        'articleNo': str(2400000000 + index),
+        'articleName': '래미안테스트',
+        'tradeTypeName': trade_type,
+        'floorInfo': f'{random.randint(1, 30)}/30',
+        'dealOrWarrantPrc': f'{random.randint(3, 30)}억 {random.randint(0, 9) * 1000:,}',
+        'rentPrc': str(random.randint(50, 300)) if trade_type == '월세' else '',
+        'area1': str(random.choice([79, 109, 142])),
+        'area2': str(random.choice([59, 84, 114])),
+        'direction': random.choice(DIRECTIONS),
+        'articleConfirmYmd': f'2025{random.randint(1, 12):02d}{random.randint(1, 28):02d}',
+        'buildingName': f'{random.randint(101, 120)}동',
+        'realtorName': random.choice(REALTORS),
+        'tagList': ['25년이내', '대단지', '역세권'],
+        'articleFeatureDesc': '올수리 남향 로얄층 즉시입주 가능',
+    }
+
+
+def make_row(article):
+    return {
+        '거래유형': article['tradeTypeName'],
+        '동': article['buildingName'],
+        '층수': article['floorInfo'].split('/')[0] + '층',
+        '전용면적': article['area2'],
+        '방향': article['direction'],
+        '거래가격': article['dealOrWarrantPrc'],
+        '월세': article['rentPrc'] or '-',
+        '중개사무소': article['realtorName'],
+        '등록일': article['articleConfirmYmd'],
+        '특징': ', '.join(article['tagList']),
+        '특징설명': article['articleFeatureDesc'],
+    }
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f'  {label:<28} {seconds * 1000:8.2f} ms')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    random.seed(0)
+    articles = [make_article(i) for i in range(count)]
+    rows = {'data': [make_row(article) for article in articles]}
+    columnar = to_columnar(rows['data'])
+    upstream = json.dumps({'isMoreData': False, 'articleList': articles}, ensure_ascii=False).encode('utf-8')
+
+    print(f'backend: {fastjson.BACKEND}, listings: {count}')
+    for name, payload in (('rows', rows), ('columnar', columnar)):
+        size = len(fastjson.dumps_bytes(payload))
+        print(f'[dumps] {name} ({size / 1024:.0f} KiB)')
+        bench('stdlib json.dumps', lambda: json.dumps(payload, separators=(',', ':')), 20)
+        bench('fastjson.dumps_bytes', lambda: fastjson.dumps_bytes(payload), 20)
+
+    print(f'[loads] upstream articleList ({len(upstream) / 1024:.0f} KiB)')
+    bench('stdlib json.loads', lambda: json.loads(upstream), 20)
+    bench('fastjson.loads', lambda: fastjson.loads(upstream), 20)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""서버 시작(콜드 스타트) 시간 벤치마크
+
+두 실행 경로의 첫 응답까지 걸리는 시간을 새 프로세스에서 측정한다.
+
+- procfile: 루트 wsgi.py (Procfile의 gunicorn wsgi:app)
+- vercel: vecel/wsgi.py (vercel.json의 빌드 대상)
+
+각 경로에서 `python -X importtime`으로 app 모듈을 불러오고 test client로 첫 요청(GET /)을
+보낸 뒤, 프로세스 시작부터 첫 응답까지의 시간과 import 시간이 큰 모듈을 출력한다.
+첫 응답 시간이 목표(TARGETS_MS)를 넘거나 지연 로딩 대상 모듈(pandas 등)이 시작 시
+불러와지면 종료 코드 1을 반환한다.
+
+    python benchmarks/bench_startup.py [반복 횟수]
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = {
+    'procfile': ROOT,
+    'vercel': os.path.join(ROOT, 'vecel'),
+}
+
+# 프로세스 시작 ~ 첫 응답 목표 시간 (ms)
+TARGETS_MS = {
+    'procfile': 1500,
+    'vercel': 1500,
+}
+
+# 첫 사용 시 불러와야 하는 무거운 모듈
+LAZY_MODULES = ('pandas', 'numpy', 'xlsxwriter', 'pyarrow', 'openpyxl', 'analytics')
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from wsgi import app
+imported = time.perf_counter()
+response = app.test_client().get('/')
+responded = time.perf_counter()
+print(json.dumps({
+    'status': response.status_code,
+    'import_ms': (imported - started) * 1000,
+    'first_request_ms': (responded - imported) * 1000,
+    'loaded_lazy_modules': [name for name in %r if name in sys.modules],
+}))
+""" % (LAZY_MODULES,)
+
+
+def parse_importtime(stderr, parent='app', limit=8):
+    """-X importtime 출력에서 parent 모듈이 직접 불러온 모듈을 누적 시간 순으로 반환"""
+    children = []
+    result = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        if depth == 2:
+            children.append((int(cumulative), name))
+        elif depth == 1:
+            if name == parent:
+                result = children
+            children = []
+    return sorted(result, reverse=True)[:limit]
+
+
+def measure(cwd):
+    env = dict(os.environ, DATABASE_URL='sqlite://', EXPIRY_SWEEPER_ENABLED='0', PYTHONDONTWRITEBYTECODE='1')
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', PROBE], cwd=cwd, env=env,
+                               capture_output=True, text=True, check=True)
+    total_ms = (time.perf_counter() - started) * 1000
+    probe = json.loads(completed.stdout.strip().splitlines()[-1])
+    return total_ms, probe, parse_importtime(completed.stderr)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    failed = False
+    for name, cwd in ENTRY_POINTS.items():
+        runs = [measure(cwd) for _ in range(repeat)]
+        total_ms, probe, heaviest = min(runs, key=lambda run: run[0])
+        target = TARGETS_MS[name]
+        status = 'OK' if total_ms <= target and not probe['loaded_lazy_modules'] else 'FAIL'
+        failed = failed or status == 'FAIL'
+        print(f"[{name}] 첫 응답까지 {total_ms:.0f} ms (목표 {target} ms) {status}")
+        print(f"  app import {probe['import_ms']:.0f} ms, 첫 요청 {probe['first_request_ms']:.0f} ms, "
+              f"HTTP {probe['status']}")
+        if probe['loaded_lazy_modules']:
+            print(f"  시작 시 불러온 지연 로딩 대상: {', '.join(probe['loaded_lazy_modules'])}")
+        for cumulative, module in heaviest:
+            print(f"    {cumulative / 1000:8.1f} ms  {module}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""gevent 워커 동시 수집 테스트
+
+느린 목(mock) 업스트림(bench_async_crawl.py와 같은 응답)을 띄우고 gevent 워커 1개로
+`gunicorn -c gunicorn_gevent.py wsgi:app`을 실행한 뒤 /fetch_data 요청을 동시에 보낸다.
+
+요청들이 green thread로 겹쳐 처리되면 업스트림 대기 시간은 한 번만 들고, 줄지 않는 것은 요청마다 드는
+CPU 시간(requests·Flask·JSON, 약 30ms)뿐이다. 그래서 동시 요청 전체 시간이
+`1건 시간 × SINGLE_LATENCY_MULTIPLE + 요청 수 × 요청당 CPU 시간 + MARGIN_SECONDS` 안에 끝나야 통과한다.
+요청당 CPU 시간은 동시 요청 동안 워커·목 업스트림·클라이언트(이 프로세스)가 쓴 CPU 시간을 /proc에서 읽어
+요청 수로 나눈 값이다. 코어가 여러 개면 CPU 시간이 병렬로 쓰이므로 한도는 더 여유 있어진다.
+
+    pip install gevent aiohttp uvicorn
+    python -m pytest benchmarks/test_gevent.py
+    GEVENT_TEST_CONCURRENCY=500 python -m pytest benchmarks/test_gevent.py
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+
+pytest.importorskip('gevent')
+pytest.importorskip('aiohttp')
+
+from bench_async_crawl import PAGE_DELAY, ROOT, crawl_burst, free_port, wait_for_port  # noqa: E402
+
+CONCURRENCY = int(os.environ.get('GEVENT_TEST_CONCURRENCY', 200))
+SINGLE_LATENCY_MULTIPLE = 2  # 업스트림 대기는 동시 요청 전체에서 1건 시간의 몇 배까지 허용할지
+MARGIN_SECONDS = 1.0
+
+pytestmark = pytest.mark.skipif(not os.path.exists('/proc/self/stat'), reason='/proc에서 CPU 시간을 읽을 수 없음')
+
+
+def cpu_seconds(pid):
+    """/proc/<pid>/stat의 utime + stime (초)"""
+    with open(f'/proc/{pid}/stat') as stat:
+        # 두 번째 필드(프로세스 이름)에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 나눈다
+        fields = stat.read().rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+def child_pids(pid):
+    pids = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as stat:
+                if int(stat.read().rsplit(')', 1)[1].split()[1]) == pid:
+                    pids.append(int(entry))
+        except (OSError, IndexError):
+            continue
+    return pids
+
+
+@pytest.fixture(scope='module')
+def gevent_server():
+    """목 업스트림과 gevent 워커 1개짜리 gunicorn을 띄우고 (gunicorn 포트, CPU 시간을 잴 프로세스 ID들)을 반환"""
+    mock_port = free_port()
+    mock = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(__file__), 'bench_async_crawl.py'),
+                             '--mock-upstream', str(mock_port)])
+    workdir = tempfile.mkdtemp(prefix='test_gevent_')
+    env = dict(os.environ,
+               DATABASE_URL=f'sqlite:///{os.path.join(workdir, "test.db")}',
+               DB_PROFILE='production',
+               EXPIRY_SWEEPER_ENABLED='0',
+               WEB_CONCURRENCY='1',
+               GEVENT_WORKER_CONNECTIONS=str(CONCURRENCY + 50),
+               PROMETHEUS_MULTIPROC_DIR=os.path.join(workdir, 'prometheus'),
+               NAVER_BASE_URL=f'http://127.0.0.1:{mock_port}',
+               NAVER_PAGE_DELAY=str(PAGE_DELAY))
+    port = free_port()
+    server = None
+    try:
+        wait_for_port(mock_port)
+        subprocess.run([sys.executable, '-c', 'from app import init_db; init_db()'], cwd=ROOT, env=env,
+                       check=True, stdout=subprocess.DEVNULL)
+        server = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn_gevent.py',
+                                   '-b', f'127.0.0.1:{port}', 'wsgi:app'],
+                                  cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        wait_for_port(port)
+        workers = child_pids(server.pid)
+        assert len(workers) == 1, f'gevent 워커가 1개가 아님: {workers}'
+        yield port, [workers[0], mock.pid]
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        mock.terminate()
+        mock.wait()
+
+
+def test_concurrent_crawls_overlap_upstream_waits(gevent_server):
+    port, pids = gevent_server
+    single = asyncio.run(crawl_burst(port, 1))
+    assert single['ok'] == 1
+
+    cpu_before = sum(cpu_seconds(pid) for pid in pids) + time.process_time()
+    burst = asyncio.run(crawl_burst(port, CONCURRENCY))
+    cpu_used = sum(cpu_seconds(pid) for pid in pids) + time.process_time() - cpu_before
+    cpu_per_request = cpu_used / CONCURRENCY
+
+    limit = single['elapsed'] * SINGLE_LATENCY_MULTIPLE + CONCURRENCY * cpu_per_request + MARGIN_SECONDS
+    print(f"\n요청 1건: {single['elapsed']:.2f}s, 요청당 CPU {cpu_per_request * 1000:.0f}ms")
+    print(f"동시 {CONCURRENCY}건: 성공 {burst['ok']}건, {burst['elapsed']:.2f}s (한도 {limit:.2f}s, "
+          f"순차 처리 시 약 {single['elapsed'] * CONCURRENCY:.0f}s), p50 {burst['p50']:.2f}s, p95 {burst['p95']:.2f}s")
+    assert burst['ok'] == CONCURRENCY
+    assert burst['elapsed'] <= limit
@@ -0,0 +1,83 @@
+"""데이터베이스 연결 설정 (프로파일별 엔진 옵션)
+
+- SQLite: production 프로파일에서 WAL 저널, synchronous=NORMAL, busy timeout을 설정해
+  여러 gunicorn 워커의 쓰기가 잠금 오류 없이 대기 후 처리되도록 한다.
+- PostgreSQL: 크기가 정해진 커넥션 풀과 pre-ping/recycle을 설정한다.
+
+프로파일은 DB_PROFILE 환경 변수(default/production)로 정하며, 없으면 FLASK_ENV가
+production일 때 production 프로파일을 사용한다.
+"""
+import os
+import sqlite3
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_DATABASE_URL = 'sqlite:///site.db'
+
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 30000))
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+
+_sqlite_pragmas_enabled = False
+
+
+def database_url():
+    url = os.environ.get('DATABASE_URL', DEFAULT_DATABASE_URL)
+    # Heroku 등은 postgres:// 형식을 쓰지만 SQLAlchemy 2.0은 postgresql://만 허용
+    if url.startswith('postgres://'):
+        url = 'postgresql://' + url[len('postgres://'):]
+    return url
+
+
+def database_profile():
+    profile = os.environ.get('DB_PROFILE')
+    if profile:
+        return profile
+    return 'production' if os.environ.get('FLASK_ENV') == 'production' else 'default'
+
+
+def engine_options(url, profile):
+    """SQLALCHEMY_ENGINE_OPTIONS (create_engine 인자)"""
+    if url.startswith('sqlite'):
+        if profile == 'production':
+            # sqlite3 모듈의 잠금 대기 시간(초). PRAGMA busy_timeout과 같은 값
+            return {'connect_args': {'timeout': SQLITE_BUSY_TIMEOUT_MS / 1000}}
+        return {}
+    return {
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_recycle': DB_POOL_RECYCLE,
+        'pool_pre_ping': True,
+    }
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record=None):
+    """SQLite 연결마다 WAL / synchronous=NORMAL / busy_timeout 설정"""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}')
+    finally:
+        cursor.close()
+
+
+@event.listens_for(Engine, 'connect')
+def _on_connect(dbapi_connection, connection_record):
+    if _sqlite_pragmas_enabled and isinstance(dbapi_connection, sqlite3.Connection):
+        set_sqlite_pragmas(dbapi_connection, connection_record)
+
+
+def init_app(app):
+    """db.init_app(app) 전에 호출해야 엔진 옵션이 적용된다."""
+    global _sqlite_pragmas_enabled
+    url = database_url()
+    profile = database_profile()
+    app.config['SQLALCHEMY_DATABASE_URI'] = url
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(url, profile)
+    _sqlite_pragmas_enabled = url.startswith('sqlite') and profile == 'production'
+    print(f"[DEBUG] 데이터베이스 프로파일: {profile} ({url.split(':', 1)[0]})")
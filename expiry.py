@@ -0,0 +1,109 @@
+"""무료 체험 만료 처리
+
+주기적으로 만료 시각이 지난 무료 체험 회원의 is_entitled를 한 번의 UPDATE로 False로
+바꾸고 만료 이벤트(SubscriptionEvent)를 기록한다. 이용 가능 여부는 요청 처리 경로
+(check_subscription)가 캐시된 세션 사용자의 만료 시각으로 직접 판단하므로, 처리가 늦어지거나
+꺼져 있어도 만료된 회원이 계속 이용하지는 못한다. 이 모듈은 상태 기록과 이벤트만 담당한다.
+
+각 gunicorn 워커가 처리 스레드를 하나씩 실행해도 UPDATE 조건(is_entitled = true)에
+걸려 실제로 바뀐 행만 이벤트를 남기므로 중복 기록되지 않는다 (RETURNING을 지원하지 않는 DB는
+한 행씩 UPDATE하고 rowcount로 확인). 스레드를 쓸 수 없는 환경에서는
+EXPIRY_SWEEPER_ENABLED=0으로 끄고 `python expiry.py`를 cron으로 실행한다.
+"""
+import os
+import threading
+import time
+from datetime import datetime
+
+import admin_stats
+import user_cache
+from models import db, User, SubscriptionEvent
+
+EXPIRY_SWEEP_INTERVAL = int(os.environ.get('EXPIRY_SWEEP_INTERVAL', 60))
+EXPIRY_SWEEPER_ENABLED = os.environ.get('EXPIRY_SWEEPER_ENABLED', '1') == '1'
+
+EVENT_EXPIRED = 'expired'
+
+_app = None
+_sweeper = None
+_lock = threading.Lock()
+
+
+def expired_condition(now):
+    # ix_user_premium_expiry (is_premium, subscription_expiry) 인덱스 범위 조건
+    return db.and_(User.is_premium == False,  # noqa: E712
+                   User.subscription_expiry <= now,
+                   User.is_admin == False,  # noqa: E712
+                   User.is_entitled == True)  # noqa: E712
+
+
+def sweep(now=None):
+    """만료된 무료 체험 회원을 일괄 처리하고 처리한 회원 수를 반환 (커밋 포함)"""
+    now = now or datetime.utcnow()
+    update = db.update(User).where(expired_condition(now)).values(is_entitled=False)
+    try:
+        if db.engine.dialect.update_returning:
+            expired = db.session.execute(
+                update.returning(User.id, User.subscription_expiry),
+                execution_options={'synchronize_session': False}).all()
+        else:
+            candidates = db.session.query(User.id, User.subscription_expiry).filter(expired_condition(now)).all()
+            expired = []
+            for user_id, expiry in candidates:
+                # 같은 조건으로 한 행씩 UPDATE: 다른 워커가 먼저 처리한 행은 rowcount가 0이라 이벤트를 남기지 않는다
+                result = db.session.execute(update.where(User.id == user_id),
+                                            execution_options={'synchronize_session': False})
+                if result.rowcount == 1:
+                    expired.append((user_id, expiry))
+        if expired:
+            db.session.execute(db.insert(SubscriptionEvent), [{
+                'user_id': user_id,
+                'event_type': EVENT_EXPIRED,
+                'subscription_expiry': expiry,
+                'created_at': now,
+            } for user_id, expiry in expired])
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if expired:
+        admin_stats.invalidate()
+        for user_id, _ in expired:
+            user_cache.invalidate(user_id)
+        print(f"[DEBUG] 무료 체험 만료 처리: {len(expired)}명")
+    return len(expired)
+
+
+def init_app(app):
+    global _app
+    _app = app
+    if EXPIRY_SWEEPER_ENABLED:
+        app.before_request(_ensure_sweeper)
+
+
+def _ensure_sweeper():
+    global _sweeper
+    if _sweeper is not None:
+        return
+    with _lock:
+        if _sweeper is None:
+            _sweeper = threading.Thread(target=_sweep_forever, name='expiry-sweeper', daemon=True)
+            _sweeper.start()
+
+
+def _sweep_forever():
+    while True:
+        try:
+            with _app.app_context():
+                sweep()
+        except Exception as e:
+            print(f"[ERROR] 무료 체험 만료 처리 중 오류: {str(e)}")
+        time.sleep(EXPIRY_SWEEP_INTERVAL)
+
+
+if __name__ == '__main__':
+    from app import app
+
+    with app.app_context():
+        print(f"만료 처리된 회원: {sweep()}명")
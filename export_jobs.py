@@ -0,0 +1,145 @@
+"""백그라운드 내보내기 작업
+
+내보내기 파일을 요청 처리 중에 메모리에서 만들지 않고, 작업 스레드가 임시 디렉터리(spool)에
+파일로 기록한다. 작업 상태는 디렉터리의 JSON 파일로 관리하므로 여러 gunicorn 워커가 같은
+작업을 조회할 수 있다. 보관 기간이 지난 파일은 주기적으로 실행되는 정리 스레드가 삭제한다.
+"""
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import metrics
+from fastjson import dumps_bytes, loads
+
+EXPORT_SPOOL_DIR = os.environ.get('EXPORT_SPOOL_DIR', os.path.join(tempfile.gettempdir(), 'apt_export_jobs'))
+EXPORT_JOB_WORKERS = int(os.environ.get('EXPORT_JOB_WORKERS', 2))
+EXPORT_RETENTION_SECONDS = int(os.environ.get('EXPORT_RETENTION_SECONDS', 3600))
+EXPORT_SWEEP_INTERVAL = int(os.environ.get('EXPORT_SWEEP_INTERVAL', 300))
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+_executor = None
+_sweeper = None
+_lock = threading.Lock()
+
+
+def _status_path(job_id):
+    return os.path.join(EXPORT_SPOOL_DIR, f'{job_id}.json')
+
+
+def file_path(job):
+    return os.path.join(EXPORT_SPOOL_DIR, f"{job['id']}{job['suffix']}")
+
+
+def _write_status(job):
+    tmp_path = _status_path(job['id']) + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(dumps_bytes(job))
+    os.replace(tmp_path, _status_path(job['id']))
+
+
+def get_job(job_id):
+    """작업 상태 조회 (없거나 잘못된 id면 None)"""
+    try:
+        uuid.UUID(job_id)
+        with open(_status_path(job_id), 'rb') as f:
+            return loads(f.read())
+    except (ValueError, FileNotFoundError):
+        return None
+
+
+def _start_background():
+    global _executor, _sweeper
+    with _lock:
+        if _executor is None:
+            os.makedirs(EXPORT_SPOOL_DIR, exist_ok=True)
+            _executor = ThreadPoolExecutor(max_workers=EXPORT_JOB_WORKERS, thread_name_prefix='export-job')
+        if _sweeper is None:
+            _sweeper = threading.Thread(target=_sweep_forever, name='export-sweeper', daemon=True)
+            _sweeper.start()
+
+
+def submit_job(user_id, filename, suffix, task):
+    """내보내기 작업 등록
+
+    task(path, report)는 path에 파일을 기록하고, report(progress, message)로 진행률(0~100)을 알린다.
+    task가 문자열을 반환하면 다운로드 파일명으로 사용한다.
+    """
+    _start_background()
+    job = {
+        'id': str(uuid.uuid4()),
+        'user_id': user_id,
+        'status': STATUS_QUEUED,
+        'progress': 0,
+        'message': '대기 중',
+        'filename': filename,
+        'suffix': suffix,
+        'size': None,
+        'error': None,
+        'created_at': time.time(),
+        'finished_at': None,
+    }
+    _write_status(job)
+    metrics.job_started('export')  # 대기 중인 작업도 포함
+    _executor.submit(_run_job, job, task)
+    return job
+
+
+def _run_job(job, task):
+    def report(progress, message):
+        job.update(status=STATUS_RUNNING, progress=int(progress), message=message)
+        _write_status(job)
+
+    path = file_path(job)
+    tmp_path = path + '.part'
+    try:
+        report(0, '작업 시작')
+        filename = task(tmp_path, report)
+        os.replace(tmp_path, path)
+        os.utime(path)  # 보관 기간은 작업 완료 시점부터 계산
+        if filename:
+            job['filename'] = filename
+        job.update(status=STATUS_DONE, progress=100, message='완료', size=os.path.getsize(path))
+    except Exception as e:
+        print(f"[ERROR] 내보내기 작업 실패 ({job['id']}): {str(e)}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        job.update(status=STATUS_FAILED, message='실패', error=str(e))
+    job['finished_at'] = time.time()
+    _write_status(job)
+    metrics.job_finished('export')
+
+
+def sweep(now=None):
+    """보관 기간이 지난 작업 파일과 상태 파일 삭제. 삭제한 파일 수를 반환"""
+    now = now or time.time()
+    removed = 0
+    try:
+        entries = list(os.scandir(EXPORT_SPOOL_DIR))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        try:
+            if now - entry.stat().st_mtime > EXPORT_RETENTION_SECONDS:
+                os.remove(entry.path)
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def _sweep_forever():
+    while True:
+        time.sleep(EXPORT_SWEEP_INTERVAL)
+        try:
+            removed = sweep()
+            if removed:
+                print(f"[DEBUG] 만료된 내보내기 파일 {removed}개 삭제")
+        except Exception as e:
+            print(f"[ERROR] 내보내기 파일 정리 중 오류: {str(e)}")
@@ -0,0 +1,6 @@
+"""gunicorn 기본 설정 (`gunicorn wsgi:app` 실행 시 자동으로 읽음)
+
+워커 설정은 gunicorn 기본값(WEB_CONCURRENCY 등 환경 변수)을 따르고, /metrics가 모든 워커의 값을
+합산하도록 Prometheus multiprocess 디렉터리만 준비한다.
+"""
+from metrics_multiprocess import on_starting, child_exit  # noqa: F401
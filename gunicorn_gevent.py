@@ -0,0 +1,77 @@
+"""gunicorn gevent 워커 설정 (협력형 green thread)
+
+    gunicorn -c gunicorn_gevent.py wsgi:app
+
+워커 하나가 green thread(greenlet)로 최대 GEVENT_WORKER_CONNECTIONS개의 요청을 동시에 처리한다.
+gevent 워커는 app을 불러오기 전에 socket / ssl / threading / time 등을 monkey patch하므로
+requests(요청마다 새 Session), SQLAlchemy 커넥션 풀의 잠금과 대기, history·expiry 백그라운드 스레드,
+time.sleep이 모두 협력형으로 동작한다. 워커 시작 시 patch 여부와 greenlet별 contextvars 분리
+(Flask 요청 컨텍스트)를 확인하고, 조건이 맞지 않으면 워커를 시작하지 않는다.
+
+- DB 커넥션 풀: 전체 워커가 DB_CONNECTION_BUDGET개를 나눠 쓰도록 워커당 크기를 정한다.
+  풀이 모자라면 greenlet이 DB_POOL_TIMEOUT까지 (협력형으로) 기다린다.
+- PostgreSQL(psycopg2)은 psycogreen이 설치되어 있으면 협력형으로 전환한다.
+- SQLite 호출은 C 확장 안에서 실행되어 양보하지 않는다. 잠금 대기가 워커 전체를 멈추지 않도록
+  busy timeout을 짧게 둔다.
+- /metrics는 모든 워커의 값을 합산한다 (metrics_multiprocess 참고).
+"""
+import os
+
+from metrics_multiprocess import on_starting, child_exit  # noqa: F401
+
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'gevent'
+worker_connections = int(os.environ.get('GEVENT_WORKER_CONNECTIONS', 500))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+# app은 워커에서 monkey patch 이후에 불러와야 한다 (마스터에서 미리 불러오면 patch 전 모듈이 fork됨)
+preload_app = False
+
+DB_CONNECTION_BUDGET = int(os.environ.get('DB_CONNECTION_BUDGET', 20))  # 모든 워커의 DB 연결 수 합계
+
+# 워커 프로세스는 마스터의 환경 변수를 물려받는다 (database.py에서 사용)
+os.environ.setdefault('DB_POOL_SIZE', str(max(DB_CONNECTION_BUDGET // workers, 1)))
+os.environ.setdefault('DB_MAX_OVERFLOW', '0')
+os.environ.setdefault('SQLITE_BUSY_TIMEOUT_MS', '5000')
+
+PATCHED_MODULES = ('socket', 'ssl', 'select', 'threading', 'time', 'queue', 'subprocess')
+
+
+def post_fork(server, worker):
+    try:
+        from psycogreen.gevent import patch_psycopg
+    except ImportError:
+        if os.environ.get('DATABASE_URL', '').startswith(('postgres://', 'postgresql://')):
+            worker.log.warning('psycogreen이 없어 PostgreSQL 쿼리가 gevent 워커를 막습니다. (pip install psycogreen)')
+        return
+    patch_psycopg()
+
+
+def check_green_safety():
+    """monkey patch와 greenlet별 contextvars 분리를 확인. 문제가 있으면 RuntimeError"""
+    import contextvars
+
+    import gevent
+    from gevent import monkey
+
+    unpatched = [name for name in PATCHED_MODULES if not monkey.is_module_patched(name)]
+    if unpatched:
+        raise RuntimeError(f"gevent monkey patch가 적용되지 않은 모듈: {', '.join(unpatched)}")
+
+    # Flask 요청/앱 컨텍스트와 Flask-SQLAlchemy 세션은 ContextVar 기준이므로 greenlet마다 분리되어야 한다
+    probe_var = contextvars.ContextVar('green_safety_probe')
+
+    def probe(value):
+        probe_var.set(value)
+        gevent.sleep(0)
+        return probe_var.get()
+
+    probes = [gevent.spawn(probe, value) for value in range(2)]
+    gevent.joinall(probes, raise_error=True)
+    if [greenlet.value for greenlet in probes] != [0, 1]:
+        raise RuntimeError('greenlet 사이에 contextvars가 공유됩니다 (greenlet 0.4.17 이상 필요)')
+
+
+def post_worker_init(worker):
+    check_green_safety()
+    worker.log.info(f"gevent 워커 확인 완료: 동시 연결 {worker_connections}, "
+                    f"DB 풀 {os.environ['DB_POOL_SIZE']}+{os.environ['DB_MAX_OVERFLOW']}")
@@ -0,0 +1,93 @@
+"""CDN 캐시용 응답 헤더와 함수 내 메모 캐시
+
+서버리스 API(api/crawl.py)의 GET 응답에 Cache-Control(s-maxage, stale-while-revalidate)과
+본문 해시 기반 강한 ETag를 붙이고, If-None-Match가 일치하면 304로 응답한다.
+함수 인스턴스가 살아 있는 동안(warm)에는 같은 요청의 직렬화된 응답 본문을 메모리에 보관한다.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Response, request
+
+from fastjson import dumps_bytes
+
+API_CACHE_TTL = int(os.environ.get('API_CACHE_TTL', 300))  # 메모 캐시 / CDN s-maxage (초)
+API_CACHE_SWR = int(os.environ.get('API_CACHE_SWR', 600))  # stale-while-revalidate (초)
+API_CACHE_SIZE = int(os.environ.get('API_CACHE_SIZE', 256))
+
+
+def content_etag(body):
+    """응답 본문(bytes)의 sha256 해시 (따옴표 없는 ETag 값)"""
+    return hashlib.sha256(body).hexdigest()[:32]
+
+
+def cache_control(s_maxage=API_CACHE_TTL, stale_while_revalidate=API_CACHE_SWR):
+    # 브라우저는 매번 ETag로 재검증하고, 공유 캐시(CDN)만 s-maxage 동안 보관한다.
+    return f'public, max-age=0, s-maxage={s_maxage}, stale-while-revalidate={stale_while_revalidate}'
+
+
+class MemoCache:
+    """TTL이 있는 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, ttl=API_CACHE_TTL, max_size=API_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """저장된 값 (없거나 만료됐으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def cacheable_json(body, etag, cached=False):
+    """직렬화된 JSON 본문으로 캐시 가능한 응답 생성 (If-None-Match 일치 시 304)"""
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control()
+    response.headers['X-Memo-Cache'] = 'HIT' if cached else 'MISS'
+    return response.make_conditional(request)
+
+
+def memoized_json(cache, key, produce):
+    """cache에 key의 응답 본문이 있으면 그대로, 없으면 produce()의 결과를 직렬화해 저장한 뒤 응답
+
+    produce()가 예외를 던지면 캐시하지 않는다 (오류 응답은 호출자가 no-store로 처리).
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        return cacheable_json(*entry, cached=True)
+    body = dumps_bytes(produce())
+    entry = (body, content_etag(body))
+    cache.set(key, entry)
+    return cacheable_json(*entry)
+
+
+def no_store(response, status):
+    """오류 응답은 CDN·브라우저가 저장하지 않도록 한다."""
+    response.headers['Cache-Control'] = 'no-store'
+    return response, status
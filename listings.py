@@ -0,0 +1,241 @@
+"""매물 데이터 변환 유틸리티"""
+import re
+from datetime import date
+
+PRICE_PATTERN = re.compile(r'^(?:(\d+(?:\.\d+)?)억)?(\d+(?:\.\d+)?)?만?$')
+
+# 엑셀/CSV 내보내기 컬럼 순서
+EXPORT_HEADERS = ['순번', '거래유형', '동', '층수', '전용면적(㎡)', '방향', '거래가격', '월세', '중개사무소', '등록일', '특징']
+
+# 숫자형 변환 컬럼 (CSV/Parquet 등 분석용 내보내기)
+TYPED_COLUMNS = ['매물번호', '거래유형', '동', '층', '전용면적', '방향', '거래가격', '월세', '중개사무소', '등록일', '특징']
+
+# 값의 종류가 적어 사전(dictionary) 인코딩 효과가 큰 컬럼
+DICTIONARY_COLUMNS = ('거래유형', '동', '방향', '중개사무소')
+
+
+def to_columnar(rows, dictionary_columns=DICTIONARY_COLUMNS):
+    """행 목록을 컬럼형 응답 구조로 변환
+
+    컬럼명은 한 번만 내보내고 값은 컬럼별 배열로 묶는다.
+    dictionary_columns에 해당하는 컬럼은 고유값 목록(dictionaries)과
+    그 인덱스 배열로 인코딩한다.
+    """
+    columns = list(rows[0].keys()) if rows else []
+    data = {column: [] for column in columns}
+    dictionaries = {column: [] for column in columns if column in dictionary_columns}
+    lookups = {column: {} for column in dictionaries}
+
+    for row in rows:
+        for column in columns:
+            value = row.get(column)
+            lookup = lookups.get(column)
+            if lookup is not None:
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(dictionaries[column])
+                    dictionaries[column].append(value)
+                value = code
+            data[column].append(value)
+
+    return {
+        'format': 'columnar',
+        'count': len(rows),
+        'columns': columns,
+        'data': data,
+        'dictionaries': dictionaries
+    }
+
+
+def get_price_info(article):
+    deal = article.get('dealOrWarrantPrc', '없음')
+    rent = article.get('rentPrc', '없음')
+    trade = article.get('tradeTypeName', '없음')
+
+    if trade == '월세':
+        return {
+            '거래가격': f"{deal}",
+            '월세': f"{rent}"
+        }
+    else:
+        return {
+            '거래가격': f"{deal}",
+            '월세': '-'
+        }
+
+
+def format_floor(floor_info):
+    """층수 표시 문자열 ("3/15" -> "3층")"""
+    if not floor_info:
+        return '-'
+    if '/' in floor_info:  # "3/15" 형태인 경우
+        return f"{floor_info.split('/')[0]}층"
+    return f"{floor_info}층"
+
+
+def listing_row(article):
+    """네이버 매물(article)을 대시보드 표시용 행으로 변환"""
+    price_info = get_price_info(article)
+    return {
+        '거래유형': article.get('tradeTypeName', '-'),
+        '동': article.get('buildingName', '-'),
+        '층수': format_floor(article.get('floorInfo', '')),
+        '전용면적': article.get('area2', '-'),
+        '방향': article.get('direction', '-'),
+        '거래가격': price_info['거래가격'],
+        '월세': price_info['월세'],
+        '중개사무소': article.get('realtorName', '-'),
+        '등록일': article.get('articleConfirmYmd', '-'),
+        '특징': ', '.join(article.get('tagList', [])) or '-',
+        '특징설명': article.get('articleFeatureDesc', '')
+    }
+
+
+def duplicate_key(article):
+    """같은 매물을 식별하는 키 (거래유형, 동, 층, 면적, 방향, 가격, 월세)
+
+    여러 중개사무소가 같은 집을 올리면 매물번호는 다르지만 이 값들은 같다.
+    """
+    trade = article.get('tradeTypeName')
+    return (
+        trade,
+        article.get('buildingName'),
+        floor_key(article.get('floorInfo')),
+        parse_area(article.get('area2')),
+        article.get('direction'),
+        parse_price(article.get('dealOrWarrantPrc')),
+        parse_price(article.get('rentPrc')) if trade == '월세' else None,
+    )
+
+
+def floor_key(floor_info):
+    """중복 판별용 층 값 ("3/15" -> 3, "저/15" -> "저", "B1/15" -> "B1")
+
+    숫자 층만 정수로 맞추고 저/중/고·지하 표시는 그대로 두어 다른 층의 매물이 묶이지 않게 한다.
+    """
+    current = str(floor_info or '').split('/')[0].strip()
+    return int(current) if current.isdigit() else current
+
+
+def duplicate_groups(articles):
+    """중복 매물을 한 번의 순회(해시 그룹핑)로 묶는다
+
+    반환값: (대표 매물 인덱스, 중개사무소 이름 목록) 목록. 대표 매물은 그룹에서 등록일이 가장 최근인 매물이며,
+    그룹 순서는 처음 등장한 순서를 따른다. 인덱스는 articles 기준이라 원본 행과 함께 보내면
+    화면에서 네이버 재조회 없이 원본/묶음 보기를 전환할 수 있다.
+    """
+    groups = {}
+    for index, article in enumerate(articles):
+        key = duplicate_key(article)
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [index, [article.get('realtorName') or '-']]
+            continue
+        realtor = article.get('realtorName') or '-'
+        if realtor not in group[1]:
+            group[1].append(realtor)
+        if str(article.get('articleConfirmYmd') or '') > str(articles[group[0]].get('articleConfirmYmd') or ''):
+            group[0] = index
+    return [(index, realtors) for index, realtors in groups.values()]
+
+
+def group_duplicates(articles):
+    """중복 매물 묶음 목록. 반환값: (대표 매물, 중개사무소 이름 목록) 목록 (duplicate_groups 참고)"""
+    return [(articles[index], realtors) for index, realtors in duplicate_groups(articles)]
+
+
+def grouped_listing_row(article, realtors):
+    """중복 묶음을 대시보드 표시용 행으로 변환 (중개사수/중개사목록 추가)"""
+    row = listing_row(article)
+    row['중개사무소'] = realtors[0] if len(realtors) == 1 else f"{realtors[0]} 외 {len(realtors) - 1}곳"
+    row['중개사수'] = len(realtors)
+    row['중개사목록'] = realtors
+    return row
+
+
+def export_rows(articles):
+    """매물 목록을 EXPORT_HEADERS 순서의 값 목록으로 하나씩 생성"""
+    for idx, article in enumerate(articles, 1):
+        price_info = get_price_info(article)
+
+        # 특징과 특징설명을 합쳐서 하나의 문자열로 만듦
+        features = list(article.get('tagList') or [])
+        feature_desc = article.get('articleFeatureDesc', '')
+        if feature_desc:
+            features.append(feature_desc)
+        features_text = ', '.join(filter(None, features)) or '-'
+
+        yield [
+            idx,  # 순번
+            article.get('tradeTypeName', '-'),
+            article.get('buildingName', '-'),
+            format_floor(article.get('floorInfo', '')),
+            article.get('area2', '-'),
+            article.get('direction', '-'),
+            price_info.get('거래가격', '-'),
+            price_info.get('월세', '-'),
+            article.get('realtorName', '-'),
+            article.get('articleConfirmYmd', '-'),
+            features_text
+        ]
+
+
+def parse_price(value):
+    """"12억 5,000" / "9억" / "5,000" 형태의 가격을 만원 단위 정수로 변환 (실패 시 None)"""
+    if value is None:
+        return None
+    text = re.sub(r'[,\s원]', '', str(value))
+    match = PRICE_PATTERN.match(text)
+    if not text or not match or (match.group(1) is None and match.group(2) is None):
+        return None
+    eok = float(match.group(1)) if match.group(1) else 0
+    man = float(match.group(2)) if match.group(2) else 0
+    return int(round(eok * 10000 + man))
+
+
+def parse_floor(floor_info):
+    """"3/15", "3층" 등에서 현재 층 숫자 추출 (지하 "B1"/"B2"는 -1/-2, "저/중/고" 등은 None)"""
+    if not floor_info:
+        return None
+    current = str(floor_info).split('/')[0].strip()
+    if current.startswith('B'):
+        digits = re.search(r'\d+', current)
+        return -int(digits.group()) if digits else -1
+    match = re.search(r'-?\d+', current)
+    if match:
+        return int(match.group())
+    return None
+
+
+def parse_area(value):
+    try:
+        return float(str(value).replace(',', ''))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_date(value):
+    """"20250131" 형태의 날짜 문자열을 date로 변환"""
+    try:
+        text = str(value)
+        return date(int(text[:4]), int(text[4:6]), int(text[6:8]))
+    except (TypeError, ValueError):
+        return None
+
+
+def typed_row(article):
+    """매물을 숫자/날짜 타입이 유지된 분석용 행으로 변환 (TYPED_COLUMNS 순서)"""
+    trade = article.get('tradeTypeName')
+    return {
+        '매물번호': article.get('articleNo'),
+        '거래유형': trade,
+        '동': article.get('buildingName'),
+        '층': parse_floor(article.get('floorInfo')),
+        '전용면적': parse_area(article.get('area2')),
+        '방향': article.get('direction'),
+        '거래가격': parse_price(article.get('dealOrWarrantPrc')),
+        '월세': parse_price(article.get('rentPrc')) if trade == '월세' else None,
+        '중개사무소': article.get('realtorName'),
+        '등록일': parse_date(article.get('articleConfirmYmd')),
+        '특징': ', '.join(article.get('tagList') or [])
+    }
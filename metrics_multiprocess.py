@@ -0,0 +1,30 @@
+"""gunicorn 워커 간 Prometheus 메트릭 합산 설정 (gunicorn 설정 파일에서 불러옴)
+
+워커들이 같은 PROMETHEUS_MULTIPROC_DIR에 값을 기록하고 /metrics가 합산한다(metrics 참고).
+이 모듈은 gunicorn 마스터에서 실행되므로 표준 라이브러리만 사용한다. 마스터에서 flask나
+prometheus_client를 불러오면 ssl이 gevent monkey patch 전에 로드되어 gevent 워커가 경고를 낸다.
+"""
+import glob
+import os
+import tempfile
+
+# 워커가 app(→ metrics)을 불러오기 전에 설정해야 한다
+MULTIPROC_DIR = os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR',
+                                      os.path.join(tempfile.gettempdir(), 'apt_prometheus'))
+
+# prometheus_client의 livesum 등 "살아 있는 워커만" 합산하는 Gauge 모드
+LIVE_GAUGE_MODES = ('liveall', 'livesum', 'livemax', 'livemin', 'livemostrecent')
+
+
+def on_starting(server):
+    """이전 실행에서 남은 메트릭 파일 삭제"""
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+    for path in glob.glob(os.path.join(MULTIPROC_DIR, '*.db')):
+        os.remove(path)
+
+
+def child_exit(server, worker):
+    """종료된 워커의 live Gauge 파일 삭제 (prometheus_client.multiprocess.mark_process_dead와 같은 동작)"""
+    for mode in LIVE_GAUGE_MODES:
+        for path in glob.glob(os.path.join(MULTIPROC_DIR, f'gauge_{mode}_{worker.pid}.db')):
+            os.remove(path)
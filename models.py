@@ -6,14 +6,100 @@ from werkzeug.security import generate_password_hash, check_password_hash
 db = SQLAlchemy()
 
 class Search(db.Model):
+    __table_args__ = (
+        db.Index('ix_search_user_created', 'user_id', 'created_at'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     keyword = db.Column(db.String(200), nullable=False)
     trade_type = db.Column(db.String(20), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     results = db.Column(db.Text)  # JSON 형식으로 검색 결과 저장
+    complex_no = db.Column(db.String(20))
+    result_count = db.Column(db.Integer, default=0)
+    results_codec = db.Column(db.String(10))  # zlib, zstd
+    results_blob = db.Column(db.LargeBinary)  # 압축된 JSON 검색 결과
+
+class Crawl(db.Model):
+    """단지별 매물 수집(스냅샷) 기록"""
+    __table_args__ = (
+        db.Index('ix_crawl_complex_trade_crawled', 'complex_no', 'trade_type', 'crawled_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    complex_no = db.Column(db.String(20), nullable=False)
+    trade_type = db.Column(db.String(20), nullable=False)  # 수집 시 거래 유형 필터 (전체, 매매, 전세, 월세)
+    crawled_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    article_count = db.Column(db.Integer, default=0)
+
+class Article(db.Model):
+    """수집 시점별 매물 (숫자형으로 정규화)"""
+    __table_args__ = (
+        db.UniqueConstraint('crawl_id', 'article_no', name='uq_article_crawl_article'),
+        db.Index('ix_article_complex_trade_date', 'complex_no', 'trade_type', 'confirm_date'),
+        db.Index('ix_article_complex_trade_price', 'complex_no', 'trade_type', 'price'),
+        db.Index('ix_article_article_crawled', 'article_no', 'crawled_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    crawl_id = db.Column(db.Integer, db.ForeignKey('crawl.id'), nullable=False)
+    article_no = db.Column(db.String(20), nullable=False)
+    complex_no = db.Column(db.String(20), nullable=False)
+    crawled_at = db.Column(db.DateTime, nullable=False)
+    trade_type = db.Column(db.String(10))
+    building = db.Column(db.String(50))
+    floor = db.Column(db.Integer)
+    floor_info = db.Column(db.String(20))
+    area = db.Column(db.Float)  # 전용면적(㎡)
+    direction = db.Column(db.String(20))
+    price = db.Column(db.BigInteger)  # 매매가/보증금 (만원)
+    rent = db.Column(db.Integer)  # 월세 (만원)
+    realtor = db.Column(db.String(100))
+    confirm_date = db.Column(db.Date)
+    tags = db.Column(db.Text)
+
+class ListingChange(db.Model):
+    """직전 수집과 비교한 매물 변동 (신규, 삭제, 가격 변경)"""
+    __table_args__ = (
+        db.Index('ix_listing_change_complex_trade_detected', 'complex_no', 'trade_type', 'detected_at'),
+        db.Index('ix_listing_change_crawl', 'crawl_id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    crawl_id = db.Column(db.Integer, db.ForeignKey('crawl.id'), nullable=False)
+    previous_crawl_id = db.Column(db.Integer, db.ForeignKey('crawl.id'), nullable=False)
+    article_id = db.Column(db.Integer, db.ForeignKey('article.id'), nullable=False)  # 삭제는 이전 수집의 매물
+    complex_no = db.Column(db.String(20), nullable=False)
+    trade_type = db.Column(db.String(20), nullable=False)  # 수집 시 거래 유형 필터
+    article_no = db.Column(db.String(20), nullable=False)
+    change_type = db.Column(db.String(20), nullable=False)  # new, delisted, price_changed
+    old_price = db.Column(db.BigInteger)  # 만원
+    new_price = db.Column(db.BigInteger)
+    old_rent = db.Column(db.Integer)
+    new_rent = db.Column(db.Integer)
+    detected_at = db.Column(db.DateTime, nullable=False)
+
+class SubscriptionEvent(db.Model):
+    """구독 상태 변경 이력 (무료 체험 만료 등)"""
+    __table_args__ = (
+        db.Index('ix_subscription_event_created', 'created_at'),
+        db.Index('ix_subscription_event_user', 'user_id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    event_type = db.Column(db.String(20), nullable=False)  # expired
+    subscription_expiry = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
 class User(UserMixin, db.Model):
+    __table_args__ = (
+        db.Index('ix_user_account_status', 'account_status'),
+        db.Index('ix_user_premium_expiry', 'is_premium', 'subscription_expiry'),
+        db.Index('ix_user_created_at', 'created_at'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
@@ -24,6 +110,8 @@ class User(UserMixin, db.Model):
     subscription_expiry = db.Column(db.DateTime)
     last_login = db.Column(db.DateTime)
     account_status = db.Column(db.String(20), default='활성')  # 활성, 휴면, 정지
+    # 만료 처리 여부 (만료 처리 스레드가 무료 체험 만료 시 False로 변경). 접근 판단은 subscription_expiry도 함께 본다
+    is_entitled = db.Column(db.Boolean, nullable=False, default=True, server_default=db.true())
     searches = db.relationship('Search', backref='user', lazy=True)
     
     def __init__(self, username, email, password, is_admin=False):
@@ -33,6 +121,7 @@ class User(UserMixin, db.Model):
         self.is_admin = is_admin
         self.is_premium = is_admin
         self.created_at = datetime.utcnow()
+        self.is_entitled = True
         
         # 무료 체험 기간 설정 (가입 기준 24시간)
         if not is_admin:
@@ -40,6 +129,12 @@ class User(UserMixin, db.Model):
         else:
             self.subscription_expiry = self.created_at + timedelta(days=36500)  # 관리자는 100년
         
+    def refresh_entitlement(self, now=None):
+        """구독 정보 변경 후 이용 가능 여부 다시 계산"""
+        now = now or datetime.utcnow()
+        self.is_entitled = bool(self.is_admin or self.is_premium
+                                or (self.subscription_expiry and self.subscription_expiry > now))
+        
     def check_password(self, password):
         return check_password_hash(self.password, password)
 
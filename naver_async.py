@@ -0,0 +1,149 @@
+"""네이버 부동산 API 비동기 클라이언트 (aiohttp)
+
+ASGI 모드(asgi.py)에서 사용한다. 프로세스 전체가 커넥션 풀 하나를 공유하고 페이지 사이 대기는
+asyncio.sleep으로 처리하므로, 업스트림 응답을 기다리는 동안 이벤트 루프가 다른 요청을 처리한다.
+취소(CancelledError)는 잡지 않고 그대로 전파되어 진행 중인 업스트림 요청도 함께 중단된다.
+반환값 규칙은 app.py의 동기 함수와 같다 (실패 시 [] 또는 None).
+"""
+import asyncio
+import os
+import time
+
+import aiohttp
+
+import metrics
+import naver
+import server_timing
+from fastjson import loads
+
+UPSTREAM_MAX_CONNECTIONS = int(os.environ.get('UPSTREAM_MAX_CONNECTIONS', 100))
+
+_session = None
+
+
+def get_session():
+    """프로세스 공용 ClientSession (이벤트 루프 안에서 처음 호출할 때 생성)"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            headers=naver.HEADERS,
+            cookies=naver.COOKIES,
+            connector=aiohttp.TCPConnector(limit=UPSTREAM_MAX_CONNECTIONS, ssl=False),
+            # 풀 대기 시간은 제한하지 않고 요청 전체 제한 시간(asgi.CRAWL_TIMEOUT)에 맡긴다
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=naver.TIMEOUT, sock_read=naver.TIMEOUT),
+        )
+    return _session
+
+
+async def aclose():
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+async def fetch(endpoint, url, **kwargs):
+    """GET 요청. 반환값: (상태 코드, 본문 bytes)
+
+    endpoint는 metrics의 업스트림 라벨 (app.naver_get과 같음)
+    """
+    start = time.perf_counter()
+    status = 'error'
+    try:
+        async with get_session().get(url, **kwargs) as response:
+            body = await response.read()
+            status = response.status
+            return status, body
+    finally:
+        elapsed = time.perf_counter() - start
+        metrics.observe_upstream(endpoint, status, elapsed)
+        server_timing.record(naver.TIMING_PHASES[endpoint], elapsed)
+
+
+async def wait_page_delay():
+    """매물 목록 페이지 사이 대기 (app.wait_page_delay의 비동기 버전)"""
+    start = time.perf_counter()
+    await asyncio.sleep(naver.PAGE_DELAY)
+    elapsed = time.perf_counter() - start
+    metrics.observe_rate_limit_wait(elapsed)
+    server_timing.record('wait', elapsed)
+
+
+@metrics.track_in_flight('search')
+async def get_complexes_by_region(keyword):
+    """아파트 단지 검색 (app.get_complexes_by_region의 비동기 버전)"""
+    try:
+        status, _ = await fetch('search_init', naver.SEARCH_INIT_URL)
+        if status != 200:
+            print(f"[ERROR] Initial request failed: {status}")
+            return []
+
+        status, body = await fetch('search', naver.SEARCH_URL, params=naver.search_params(keyword))
+        if status != 200:
+            print(f"[ERROR] API request failed: {body[:500]}")
+            return []
+
+        complexes = loads(body).get('complexes', [])
+        complexes.sort(key=lambda x: x['complexName'])
+        return complexes
+    except Exception as e:
+        print(f"[ERROR] API error: {str(e)}")
+        return []
+
+
+@metrics.track_in_flight('complex_info')
+async def get_complex_info(complex_no):
+    """단지 상세 정보 조회 (app.get_complex_info의 비동기 버전)"""
+    headers = {'Referer': naver.complex_url(complex_no)}
+    try:
+        status, _ = await fetch('complex', naver.complex_url(complex_no), headers=headers)
+        if status != 200:
+            print(f"[ERROR] Initial request failed: {status}")
+            return None
+
+        status, body = await fetch('overview', naver.complex_overview_url(complex_no), headers=headers)
+        if status != 200:
+            print(f"[ERROR] Complex info request failed: {body[:500]}")
+            return None
+        return loads(body)
+    except Exception as e:
+        print(f"[ERROR] Error in get_complex_info: {str(e)}")
+        return None
+
+
+@metrics.track_in_flight('article_list')
+async def get_article_list(complex_no, trade_type=''):
+    """모든 페이지의 매물 목록 조회 (app.get_article_list의 비동기 버전)"""
+    headers = {'Referer': naver.complex_url(complex_no)}
+    try:
+        status, _ = await fetch('complex', naver.complex_url(complex_no), headers=headers)
+        if status != 200:
+            print(f"[ERROR] Initial request failed: {status}")
+            return None
+
+        all_articles = []
+        current_page = 1
+        while True:
+            status, body = await fetch('articles', naver.article_list_url(complex_no), headers=headers,
+                                       params=naver.article_list_params(complex_no, trade_type, current_page))
+            if status != 200:
+                print(f"[ERROR] Article list request failed: {body[:500]}")
+                return None
+
+            data = loads(body)
+            articles = data.get('articleList', [])
+            if not articles:
+                break
+            all_articles.extend(articles)
+            if not data.get('isMoreData', False):
+                break
+
+            current_page += 1
+            await wait_page_delay()
+
+        metrics.observe_crawl_pages(current_page)
+        print(f"[DEBUG] 비동기 매물 수집 완료: {complex_no} ({current_page}페이지, {len(all_articles)}건)")
+        return {'articleList': all_articles}
+    except Exception as e:
+        print(f"[ERROR] Error in get_article_list: {str(e)}")
+        return None
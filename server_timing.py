@@ -0,0 +1,85 @@
+"""요청 단계별 처리 시간 (Server-Timing 헤더)
+
+span(name)으로 감싼 구간의 시간을 요청마다 모아 응답의 Server-Timing 헤더로 보낸다.
+브라우저 개발자 도구(Network > Timing)에서 바로 볼 수 있다. 같은 이름의 구간은 합산하고,
+두 번 이상 실행됐으면 desc에 횟수를 표시한다 (예: paging;dur=1520.4;desc="x3").
+
+SERVER_TIMING_LOG=1이면 구간이 기록된 요청마다 `[TRACE] {...}` JSON 한 줄을 출력한다.
+스트리밍 응답(CSV)의 본문 전송은 헤더를 보낸 뒤에 일어나므로 포함되지 않는다.
+요청 컨텍스트 밖(백그라운드 내보내기 작업 등)에서는 아무것도 기록하지 않는다.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+from flask import g, has_request_context, request
+from flask_login import current_user
+
+from fastjson import dumps_bytes
+
+SERVER_TIMING_ENABLED = os.environ.get('SERVER_TIMING_ENABLED', '1') == '1'
+SERVER_TIMING_LOG = os.environ.get('SERVER_TIMING_LOG', '0') == '1'
+
+
+def record(name, seconds):
+    """현재 요청에 name 구간 시간 추가"""
+    if not SERVER_TIMING_ENABLED or not has_request_context():
+        return
+    spans = g.setdefault('server_timing_spans', {})
+    total, count = spans.get(name, (0.0, 0))
+    spans[name] = (total + seconds, count + 1)
+
+
+@contextmanager
+def span(name):
+    """with 블록의 실행 시간을 name 구간으로 기록 (async 함수 안에서도 사용 가능)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def header_value(spans, total):
+    parts = []
+    for name, (seconds, count) in spans.items():
+        part = f'{name};dur={seconds * 1000:.1f}'
+        if count > 1:
+            part += f';desc="x{count}"'
+        parts.append(part)
+    parts.append(f'total;dur={total * 1000:.1f}')
+    return ', '.join(parts)
+
+
+def trace_record(response, spans, total):
+    return {
+        'method': request.method,
+        'path': request.path,
+        'status': response.status_code,
+        'user_id': getattr(current_user, 'id', None),
+        'total_ms': round(total * 1000, 1),
+        'spans': {name: {'ms': round(seconds * 1000, 1), 'count': count}
+                  for name, (seconds, count) in spans.items()},
+    }
+
+
+def init_app(app):
+    """app에 Server-Timing 헤더를 붙이는 훅 등록"""
+    if not SERVER_TIMING_ENABLED:
+        return
+
+    @app.before_request
+    def start_server_timing():
+        g.server_timing_started = time.perf_counter()
+
+    @app.after_request
+    def add_server_timing(response):
+        spans = g.pop('server_timing_spans', None)
+        started = g.pop('server_timing_started', None)
+        if not spans or started is None:
+            return response
+        total = time.perf_counter() - started
+        response.headers['Server-Timing'] = header_value(spans, total)
+        if SERVER_TIMING_LOG:
+            print(f"[TRACE] {dumps_bytes(trace_record(response, spans, total)).decode()}")
+        return response
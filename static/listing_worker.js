@@ -0,0 +1,183 @@
+// 매물 목록 정렬/필터 전용 Web Worker
+// 매물 데이터를 컬럼별 typed array로 보관하고, 정렬/필터 요청에 대해
+// 인덱스 순열(Uint32Array)만 돌려준다. 숫자 파싱은 로드 시 한 번만 수행한다.
+
+const NUMERIC_COLUMNS = ['거래가격', '월세', '전용면적', '층수', '등록일'];
+const TEXT_COLUMNS = ['거래유형', '동', '방향', '중개사무소', '특징'];
+
+let rowCount = 0;
+let columns = {};       // 컬럼명 -> Float64Array(숫자) 또는 Uint32Array(문자열 순위)
+let tradeTypeCodes = null;
+let tradeTypeLabels = [];
+
+// "12억 5,000" / "9억" / "5,000" 형태의 가격을 만원 단위 숫자로 변환
+function parsePrice(value) {
+    if (value === null || value === undefined) return NaN;
+    const text = String(value).replace(/[,\s원]/g, '');
+    if (!text || text === '-') return NaN;
+    const match = /^(?:(\d+(?:\.\d+)?)억)?(\d+(?:\.\d+)?)?(?:만)?$/.exec(text);
+    if (!match || (match[1] === undefined && match[2] === undefined)) return NaN;
+    const eok = match[1] ? parseFloat(match[1]) : 0;
+    const man = match[2] ? parseFloat(match[2]) : 0;
+    return eok * 10000 + man;
+}
+
+// "3층", "3/15", "저층" 등에서 현재 층 숫자만 추출 (지하 "B1층"/"B2"는 -1/-2)
+function parseFloor(value) {
+    if (value === null || value === undefined) return NaN;
+    const text = String(value).split('/')[0].trim();
+    if (text.startsWith('B')) {
+        const digits = /\d+/.exec(text);
+        return digits ? -parseInt(digits[0], 10) : -1;
+    }
+    const match = /-?\d+/.exec(text);
+    if (match) return parseInt(match[0], 10);
+    return NaN;
+}
+
+function parseNumber(value) {
+    if (value === null || value === undefined || value === '' || value === '-') return NaN;
+    const number = parseFloat(String(value).replace(/,/g, ''));
+    return isNaN(number) ? NaN : number;
+}
+
+const PARSERS = {
+    '거래가격': parsePrice,
+    '월세': parsePrice,
+    '전용면적': parseNumber,
+    '층수': parseFloor,
+    '등록일': parseNumber
+};
+
+// 문자열 컬럼은 고유값을 한 번 정렬해 순위(정수)로 치환한다.
+// dictionary가 주어지면(컬럼형 응답) 행 단위 문자열 비교 없이 코드만 재매핑한다.
+function encodeText(values, dictionary) {
+    let labels = dictionary;
+    let codesIn = values;
+    if (!labels) {
+        const unique = new Map();
+        codesIn = new Uint32Array(values.length);
+        labels = [];
+        for (let i = 0; i < values.length; i++) {
+            const value = values[i] == null ? '' : String(values[i]);
+            let code = unique.get(value);
+            if (code === undefined) {
+                code = labels.length;
+                unique.set(value, code);
+                labels.push(value);
+            }
+            codesIn[i] = code;
+        }
+    }
+    const order = labels.map((label, code) => code)
+        .sort((a, b) => String(labels[a] == null ? '' : labels[a]).localeCompare(String(labels[b] == null ? '' : labels[b]), 'ko', { numeric: true }));
+    const rankOf = new Uint32Array(labels.length);
+    order.forEach((code, rank) => { rankOf[code] = rank; });
+
+    const codes = new Uint32Array(values.length);
+    for (let i = 0; i < values.length; i++) {
+        codes[i] = rankOf[codesIn[i]];
+    }
+    const sortedLabels = order.map(code => labels[code] == null ? '' : String(labels[code]));
+    return { codes, labels: sortedLabels };
+}
+
+// 행 배열({컬럼: 값}) 또는 컬럼형 응답({columns, data, dictionaries})을 컬럼 배열로 정규화
+function toColumns(message) {
+    if (message.columnar) {
+        return {
+            count: message.columnar.count,
+            data: message.columnar.data,
+            dictionaries: message.columnar.dictionaries || {}
+        };
+    }
+    const rows = message.rows;
+    const data = {};
+    NUMERIC_COLUMNS.concat(TEXT_COLUMNS).forEach(column => {
+        data[column] = rows.map(row => row[column]);
+    });
+    return { count: rows.length, data, dictionaries: {} };
+}
+
+function load(message) {
+    const source = toColumns(message);
+    rowCount = source.count;
+    columns = {};
+
+    NUMERIC_COLUMNS.forEach(column => {
+        const parse = PARSERS[column];
+        const raw = source.data[column] || [];
+        const dictionary = source.dictionaries[column];
+        const values = new Float64Array(rowCount);
+        for (let i = 0; i < rowCount; i++) {
+            values[i] = parse(dictionary ? dictionary[raw[i]] : raw[i]);
+        }
+        columns[column] = values;
+    });
+
+    TEXT_COLUMNS.forEach(column => {
+        const encoded = encodeText(source.data[column] || new Array(rowCount), source.dictionaries[column]);
+        columns[column] = encoded.codes;
+        if (column === '거래유형') {
+            tradeTypeCodes = encoded.codes;
+            tradeTypeLabels = encoded.labels;
+        }
+    });
+}
+
+function filterIndices(tradeType) {
+    if (!tradeType || tradeType === '전체') {
+        const all = new Uint32Array(rowCount);
+        for (let i = 0; i < rowCount; i++) all[i] = i;
+        return all;
+    }
+    const code = tradeTypeLabels.indexOf(tradeType);
+    if (code < 0) return new Uint32Array(0);
+
+    let count = 0;
+    for (let i = 0; i < rowCount; i++) {
+        if (tradeTypeCodes[i] === code) count++;
+    }
+    const indices = new Uint32Array(count);
+    let cursor = 0;
+    for (let i = 0; i < rowCount; i++) {
+        if (tradeTypeCodes[i] === code) indices[cursor++] = i;
+    }
+    return indices;
+}
+
+function sortIndices(indices, column, ascending) {
+    const values = columns[column];
+    if (!values) {
+        // 순번 등 원본 순서 정렬
+        if (!ascending) indices.reverse();
+        return indices;
+    }
+    const direction = ascending ? 1 : -1;
+    // 값이 없는(NaN) 행은 정렬 방향과 무관하게 항상 뒤로 보낸다.
+    indices.sort((a, b) => {
+        const valueA = values[a];
+        const valueB = values[b];
+        const missingA = valueA !== valueA;
+        const missingB = valueB !== valueB;
+        if (missingA || missingB) {
+            if (missingA && missingB) return a - b;
+            return missingA ? 1 : -1;
+        }
+        if (valueA < valueB) return -direction;
+        if (valueA > valueB) return direction;
+        return a - b;
+    });
+    return indices;
+}
+
+self.onmessage = function(event) {
+    const message = event.data;
+    if (message.type === 'load') {
+        load(message);
+        self.postMessage({ type: 'loaded', count: rowCount });
+    } else if (message.type === 'query') {
+        const indices = sortIndices(filterIndices(message.tradeType), message.column, message.ascending);
+        self.postMessage({ type: 'result', id: message.id, indices }, [indices.buffer]);
+    }
+};
@@ -0,0 +1,5 @@
+"""테스트에서 저장소 루트의 모듈(listings 등)을 불러올 수 있도록 sys.path에 추가"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
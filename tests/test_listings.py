@@ -0,0 +1,19 @@
+import pytest
+
+from listings import parse_floor
+
+
+@pytest.mark.parametrize('floor_info, expected', [
+    ('3/15', 3),
+    ('3층', 3),
+    ('B1/15', -1),
+    ('B2', -2),
+    ('B', -1),
+    ('저/15', None),
+    ('중/15', None),
+    ('고/15', None),
+    ('', None),
+    (None, None),
+])
+def test_parse_floor(floor_info, expected):
+    assert parse_floor(floor_info) == expected
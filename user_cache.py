@@ -0,0 +1,79 @@
+"""로그인 사용자 캐시 (Flask-Login user_loader용)
+
+요청마다 User 행을 조회하지 않도록 권한 판단에 필요한 필드만 담은 읽기 전용 스냅샷을
+프로세스 메모리에 짧은 TTL 동안 보관한다. 회원 정보를 바꾸는 코드는 커밋 후
+invalidate()를 호출해야 한다. 여러 gunicorn 워커 사이의 불일치는 TTL로 제한된다.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask_login import UserMixin
+
+import metrics
+from models import db, User
+
+USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL', 30))
+USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', 1024))
+
+SNAPSHOT_FIELDS = ('id', 'username', 'email', 'is_admin', 'is_premium', 'is_entitled', 'account_status',
+                   'subscription_expiry', 'created_at')
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+class SessionUser(UserMixin):
+    """current_user로 쓰이는 User 스냅샷 (수정 불가). 변경은 User 행을 조회해서 한다."""
+
+    def __init__(self, user):
+        for field in SNAPSHOT_FIELDS:
+            object.__setattr__(self, field, getattr(user, field))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('SessionUser는 읽기 전용입니다. User 행을 조회해서 수정하세요.')
+
+    @property
+    def is_active(self):
+        return self.account_status == '활성'
+
+    @property
+    def is_authenticated(self):
+        # User와 같이 정지된 계정도 인증 상태로 두고, 활성 여부는 각 라우트에서 확인
+        return True
+
+    def get_id(self):
+        return str(self.id)
+
+
+def load(user_id):
+    """캐시된 스냅샷 반환 (없거나 만료되면 DB에서 조회, 회원이 없으면 None)"""
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(user_id)
+        if entry is not None and entry[1] > now:
+            _cache.move_to_end(user_id)
+            metrics.cache_lookup('user', True)
+            return entry[0]
+
+    metrics.cache_lookup('user', False)
+    user = db.session.get(User, user_id)
+    if user is None:
+        return None
+    snapshot = SessionUser(user)
+    with _lock:
+        _cache[user_id] = (snapshot, now + USER_CACHE_TTL)
+        _cache.move_to_end(user_id)
+        while len(_cache) > USER_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return snapshot
+
+
+def invalidate(user_id=None):
+    """user_id의 스냅샷 삭제 (None이면 전체)"""
+    with _lock:
+        if user_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(user_id, None)
@@ -0,0 +1,60 @@
+"""관리자 대시보드 회원 통계
+
+전체/활성/무료 체험/유료/만료 회원 수를 조건부 SUM 집계 쿼리 한 번으로 계산하고,
+짧은 TTL 동안 프로세스 메모리에 캐시한다. 회원 상태를 바꾸는 관리자 API는
+invalidate()로 캐시를 바로 비운다.
+"""
+import os
+import threading
+import time
+
+from sqlalchemy import case, func
+
+from models import db, User
+
+ADMIN_STATS_TTL = int(os.environ.get('ADMIN_STATS_TTL', 30))
+
+_cached = None
+_expires_at = 0
+_lock = threading.Lock()
+
+
+def _count_if(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def query_user_stats():
+    """회원 통계를 한 번의 테이블(인덱스) 스캔으로 조회"""
+    total, active, trial, premium, expired = db.session.query(
+        func.count(User.id),
+        _count_if(User.account_status == '활성'),
+        _count_if(User.is_premium == False),  # noqa: E712
+        _count_if(User.is_premium == True),  # noqa: E712
+        _count_if(User.is_entitled == False),  # noqa: E712
+    ).one()
+    return {
+        'total_users': total,
+        'active_users': active,
+        'trial_users': trial,
+        'premium_users': premium,
+        'expired_users': expired,
+    }
+
+
+def get_user_stats():
+    """캐시된 회원 통계 (TTL이 지났으면 다시 조회)"""
+    global _cached, _expires_at
+    with _lock:
+        if _cached is not None and time.monotonic() < _expires_at:
+            return _cached
+    stats = query_user_stats()
+    with _lock:
+        _cached = stats
+        _expires_at = time.monotonic() + ADMIN_STATS_TTL
+    return stats
+
+
+def invalidate():
+    global _cached
+    with _lock:
+        _cached = None
@@ -0,0 +1,148 @@
+"""단지 매물 가격 분석 (pandas / NumPy)
+
+매물 목록을 컬럼형 DataFrame으로 만든 뒤 거래유형 x 면적대별로 매물 수, 최저가,
+중위가, 상위 10% 가격(p90), ㎡당/평당 가격을 계산한다. 가격·면적 문자열 파싱과
+집계는 모두 벡터 연산으로 처리하고, 같은 데이터셋(해시)의 결과는 메모리에 캐시한다.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import metrics
+from exporter import AREA_BANDS
+from listings import parse_area, parse_price
+
+SQUARE_METERS_PER_PYEONG = 3.305785
+ANALYTICS_CACHE_SIZE = 128
+UNKNOWN_BAND = '미상'
+
+# 면적대 경계 (area <= 경계 이면 해당 구간)
+BAND_EDGES = np.array([limit for limit, _ in AREA_BANDS if limit is not None], dtype=float)
+BAND_NAMES = np.array([name for _, name in AREA_BANDS] + [UNKNOWN_BAND], dtype=object)
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def parse_unique(values, parse):
+    """고유값만 parse로 변환한 뒤 코드 배열로 펼쳐 float 배열을 만든다 (실패·None은 NaN)
+
+    가격·면적 문자열은 종류가 적어서 pd.factorize로 묶으면 파싱 횟수가 매물 수가 아니라
+    고유값 수에 비례한다.
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    # 마지막 원소(NaN)는 코드 -1(None) 자리
+    parsed = np.array([parse(value) for value in uniques] + [None], dtype=float)
+    return parsed[codes]
+
+
+def parse_prices(values):
+    """"12억 5,000" 형태의 가격 문자열 배열을 만원 단위 float 배열로 변환"""
+    return parse_unique(values, parse_price)
+
+
+def parse_areas(values):
+    return parse_unique(values, parse_area)
+
+
+def area_bands(areas):
+    """전용면적 배열을 면적대 이름 배열로 변환 (exporter.area_band의 벡터 버전)"""
+    index = np.searchsorted(BAND_EDGES, areas, side='left')
+    index[np.isnan(areas)] = len(BAND_NAMES) - 1
+    return BAND_NAMES[index]
+
+
+def build_frame(trade_types, areas, prices):
+    areas = np.asarray(areas, dtype=float)
+    return pd.DataFrame({
+        '거래유형': pd.Categorical(trade_types),
+        '면적대': pd.Categorical(area_bands(areas), categories=BAND_NAMES),
+        '전용면적': areas,
+        '가격': np.asarray(prices, dtype=float),
+    })
+
+
+def frame_from_articles(articles):
+    """네이버 매물(article) 목록을 분석용 DataFrame으로 변환"""
+    return build_frame(
+        [article.get('tradeTypeName') or '-' for article in articles],
+        parse_areas([article.get('area2') for article in articles]),
+        parse_prices([article.get('dealOrWarrantPrc') for article in articles]),
+    )
+
+
+def frame_from_records(records):
+    """(거래유형, 전용면적, 가격) 튜플 목록(Article 조회 결과)을 DataFrame으로 변환"""
+    if not records:
+        return build_frame([], [], [])
+    trade_types, areas, prices = zip(*records)
+    return build_frame(
+        [trade_type or '-' for trade_type in trade_types],
+        np.array(areas, dtype=float),
+        np.array(prices, dtype=float),
+    )
+
+
+def frame_key(frame):
+    """DataFrame 내용의 해시 (캐시 키)"""
+    hashed = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+    return hashlib.sha256(hashed.tobytes()).hexdigest()
+
+
+def _round(value):
+    return None if pd.isna(value) else int(round(value))
+
+
+def aggregate(frame):
+    """거래유형 x 면적대별 가격 통계 목록 (가격은 만원, ㎡당/평당은 중위값 기준)"""
+    priced = frame[frame['가격'].notna()]
+    per_m2 = priced['가격'] / priced['전용면적'].where(priced['전용면적'] > 0)
+    grouped = priced.assign(per_m2=per_m2).groupby(['거래유형', '면적대'], observed=True, sort=True)
+
+    prices = grouped['가격']
+    stats = pd.DataFrame({
+        'count': prices.size(),
+        'min': prices.min(),
+        'median': prices.median(),
+        'p90': prices.quantile(0.9),
+        'per_m2': grouped['per_m2'].median(),
+    }).sort_index()  # 거래유형 가나다순, 면적대는 AREA_BANDS 순서
+
+    groups = []
+    for (trade_type, band), row in stats.iterrows():
+        groups.append({
+            'trade_type': trade_type,
+            'area_band': band,
+            'count': int(row['count']),
+            'min': _round(row['min']),
+            'median': _round(row['median']),
+            'p90': _round(row['p90']),
+            'per_m2': _round(row['per_m2']),
+            'per_pyeong': _round(row['per_m2'] * SQUARE_METERS_PER_PYEONG),
+        })
+    return {
+        'count': len(frame),
+        'unpriced': int(len(frame) - len(priced)),
+        'groups': groups,
+    }
+
+
+def summarize(frame):
+    """aggregate 결과를 데이터셋 해시로 캐시해서 반환. 반환값: (결과, 캐시 적중 여부)"""
+    key = frame_key(frame)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            metrics.cache_lookup('analytics', True)
+            return _cache[key], True
+
+    metrics.cache_lookup('analytics', False)
+    result = aggregate(frame)
+    with _cache_lock:
+        _cache[key] = result
+        while len(_cache) > ANALYTICS_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result, False
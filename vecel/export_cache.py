@@ -0,0 +1,114 @@
+"""내보내기 파일 디스크 캐시
+
+정규화된 행 데이터와 내보내기 옵션의 해시를 키로 생성된 파일을 저장한다.
+같은 데이터로 같은 형식을 다시 요청하면 파일을 새로 만들지 않고 디스크에서 바로 보낸다.
+전체 크기가 상한을 넘으면 가장 오래 사용되지 않은 파일부터 삭제한다(LRU).
+조회·생성 후 EXPORT_CACHE_GRACE_SECONDS 안의 파일은 지우지 않으므로, 경로를 받은 요청이
+파일을 열기 전에 다른 요청(다른 워커 포함)의 정리 작업이 파일을 지우지 않는다.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+import metrics
+from fastjson import dumps_bytes
+
+EXPORT_CACHE_DIR = os.environ.get('EXPORT_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'apt_export_cache'))
+EXPORT_CACHE_MAX_BYTES = int(os.environ.get('EXPORT_CACHE_MAX_BYTES', 512 * 1024 * 1024))
+# 최근 조회·생성된 파일은 이 시간(초) 동안 정리 대상에서 제외 (send_file로 열기 전 삭제 방지)
+EXPORT_CACHE_GRACE_SECONDS = int(os.environ.get('EXPORT_CACHE_GRACE_SECONDS', 60))
+
+
+def _default(value):
+    # date 등 JSON 기본 타입이 아닌 값은 문자열로 해시
+    return str(value)
+
+
+def dataset_key(rows, **options):
+    """행 데이터와 옵션으로 캐시 키(sha256 hex) 계산"""
+    digest = hashlib.sha256()
+    digest.update(dumps_bytes(options, default=_default, sort_keys=True))
+    for row in rows:
+        digest.update(dumps_bytes(row, default=_default, sort_keys=True))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+class ExportCache:
+    def __init__(self, directory=EXPORT_CACHE_DIR, max_bytes=EXPORT_CACHE_MAX_BYTES,
+                 grace_seconds=EXPORT_CACHE_GRACE_SECONDS):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.grace_seconds = grace_seconds
+        self._lock = threading.Lock()
+
+    def path_for(self, key, suffix):
+        return os.path.join(self.directory, f'{key}{suffix}')
+
+    def get(self, key, suffix):
+        """캐시된 파일 경로 (없으면 None). 조회 시 수정 시각을 갱신해 LRU 순서를 유지"""
+        path = self.path_for(key, suffix)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def get_or_create(self, key, suffix, build):
+        """캐시된 파일 경로를 반환하고, 없으면 build(path)로 생성한 뒤 저장
+
+        반환값: (경로, 캐시 적중 여부)
+        """
+        path = self.get(key, suffix)
+        metrics.cache_lookup('export', path is not None)
+        if path is not None:
+            return path, True
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=suffix, prefix='.tmp-', dir=self.directory)
+        os.close(fd)
+        try:
+            start = time.perf_counter()
+            build(tmp_path)
+            metrics.observe_export(suffix.lstrip('.'), time.perf_counter() - start, os.path.getsize(tmp_path))
+            # 원자적 교체: 동시에 같은 파일을 만든 요청이 있어도 내용은 동일하다
+            os.replace(tmp_path, self.path_for(key, suffix))
+            os.utime(self.path_for(key, suffix))  # 정리 유예 시간은 생성 완료 시각부터
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+        return self.path_for(key, suffix), False
+
+    def evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 사용되지 않은 파일부터 삭제
+
+        grace_seconds 안에 조회·생성된 파일은 곧 전송될 수 있으므로 남긴다 (상한을 잠시 넘을 수 있음).
+        """
+        with self._lock:
+            grace_start = time.time() - self.grace_seconds
+            entries = []
+            total = 0
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.is_file() or entry.name.startswith('.tmp-'):
+                        continue
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+            entries.sort()
+            for mtime, size, path in entries:
+                if total <= self.max_bytes or mtime >= grace_start:
+                    break
+                try:
+                    os.remove(path)  # 전송 중인 파일은 열린 핸들이 유지되므로 안전
+                    total -= size
+                except FileNotFoundError:
+                    pass
+
+
+export_cache = ExportCache()
@@ -0,0 +1,341 @@
+"""매물 내보내기 엔진 (xlsx / csv / parquet)
+
+xlsxwriter의 constant_memory 모드로 행을 순차 기록하므로 매물 수와 관계없이
+메모리 사용량이 일정하다. 셀 서식은 워크북 단위로 한 번만 만들어 공유하고,
+열 너비는 행을 기록하는 한 번의 순회에서 함께 계산한다.
+
+xlsxwriter / pyarrow는 실제로 파일을 만들 때 불러온다 (서버 시작 시간 단축).
+"""
+import csv
+import io
+import multiprocessing
+import os
+import re
+import statistics
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from listings import EXPORT_HEADERS, TYPED_COLUMNS, export_rows, parse_area, parse_price
+
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+CSV_MIMETYPE = 'text/csv; charset=utf-8'
+PARQUET_MIMETYPE = 'application/vnd.apache.parquet'
+
+CSV_FLUSH_ROWS = 1000
+PARQUET_BATCH_ROWS = 10000
+
+SUMMARY_HEADERS = ['단지명', '거래유형', '면적대', '매물 수', '최저가(만원)', '중위가(만원)', '최고가(만원)']
+SUMMARY_SHEET_NAME = '요약'
+# (상한 면적, 이름) - 전용면적 기준 구간
+AREA_BANDS = [(60, '60㎡ 이하'), (85, '60~85㎡'), (135, '85~135㎡'), (None, '135㎡ 초과')]
+
+# 단지별 시트 준비 작업을 실행할 프로세스 수 (기본: CPU 코어 수)
+# gunicorn 워커마다 풀을 하나씩 만들므로 기본값은 워커 수로 나눈 코어 수 (전체 합계 ≈ 코어 수)
+EXPORT_PROCESSES = int(os.environ.get('EXPORT_PROCESSES',
+                                      max((os.cpu_count() or 1) // int(os.environ.get('WEB_CONCURRENCY', 1)), 1)))
+
+FEATURE_COLUMN = 10  # 특징 컬럼 (0부터 시작)
+REALTOR_COLUMN = 8   # 중개사무소 컬럼
+TITLE_ROW_HEIGHT = 35
+HEADER_ROW_HEIGHT = 30
+DATA_ROW_HEIGHT = 30
+
+
+def create_formats(workbook):
+    """워크북에서 공유하는 셀 서식 생성"""
+    border = {'border': 1}
+    return {
+        'title': workbook.add_format({
+            'bold': True, 'font_size': 14, 'align': 'center', 'valign': 'vcenter',
+            'bg_color': '#E2EFDA', **border
+        }),
+        'header': workbook.add_format({
+            'bold': True, 'font_size': 10, 'align': 'center', 'valign': 'vcenter',
+            'bg_color': '#CCCCCC', **border
+        }),
+        'cell': workbook.add_format({
+            'font_size': 10, 'align': 'center', 'valign': 'vcenter', **border
+        }),
+        'feature': workbook.add_format({
+            'font_size': 10, 'align': 'left', 'valign': 'vcenter', 'text_wrap': True, **border
+        }),
+    }
+
+
+def safe_sheet_name(name, used=()):
+    """엑셀 시트 이름 규칙(31자, 특수문자 제외, 중복 불가)에 맞게 변환"""
+    base = re.sub(r'[\[\]:*?/\\]', '_', str(name or '매물정보')).strip("'") or '매물정보'
+    base = base[:31]
+    candidate = base
+    suffix = 2
+    while candidate.lower() in {u.lower() for u in used}:
+        tail = f' ({suffix})'
+        candidate = base[:31 - len(tail)] + tail
+        suffix += 1
+    return candidate
+
+
+def column_width(col, width):
+    # 특징 컬럼은 최대 50자 너비로 제한, 중개사무소 컬럼은 전체 텍스트 반영, 다른 컬럼은 최소 8자 이상으로 설정
+    if col == FEATURE_COLUMN:
+        return min(width + 2, 50)
+    if col == REALTOR_COLUMN:
+        return width + 2
+    return max(width + 2, 8)
+
+
+def write_listing_sheet(workbook, formats, sheet_name, title, rows, headers=EXPORT_HEADERS, widths=None):
+    """매물 행(rows)을 한 시트에 기록하고 기록한 행 수를 반환
+
+    widths가 주어지면 열 너비 계산을 건너뛰고 그 값을 그대로 사용한다.
+    """
+    ws = workbook.add_worksheet(sheet_name)
+    last_col = len(headers) - 1
+    ws.set_default_row(DATA_ROW_HEIGHT)
+
+    # 제목 행 (셀 병합)
+    ws.set_row(0, TITLE_ROW_HEIGHT)
+    ws.merge_range(0, 0, 0, last_col, title, formats['title'])
+
+    # 헤더 행
+    ws.set_row(1, HEADER_ROW_HEIGHT)
+    ws.write_row(1, 0, headers, formats['header'])
+
+    max_widths = list(widths) if widths else [len(header) for header in headers]
+    cell_format = formats['cell']
+    feature_format = formats['feature']
+
+    row_idx = 1
+    for row_idx, row_data in enumerate(rows, 2):
+        for col, value in enumerate(row_data):
+            ws.write(row_idx, col, value, feature_format if col == FEATURE_COLUMN else cell_format)
+            if widths:
+                continue
+            length = len(str(value))
+            if length > max_widths[col]:
+                max_widths[col] = length
+
+    # 열 너비 설정 (constant_memory 모드에서도 열 정보는 저장 시점에 기록됨)
+    for col, width in enumerate(max_widths):
+        ws.set_column(col, col, column_width(col, width))
+
+    # 자동 필터 설정
+    ws.autofilter(1, 0, row_idx, last_col)
+    return row_idx - 1
+
+
+def build_listing_workbook(output, sheet_name, title, rows):
+    """매물 목록 엑셀 파일을 output(경로 또는 파일 객체)에 기록"""
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True, 'tmpdir': tempfile.gettempdir()})
+    try:
+        formats = create_formats(workbook)
+        count = write_listing_sheet(workbook, formats, safe_sheet_name(sheet_name), title, rows)
+    finally:
+        workbook.close()
+    return count
+
+
+def area_band(area):
+    if area is None:
+        return '미상'
+    for limit, name in AREA_BANDS:
+        if limit is None or area <= limit:
+            return name
+
+
+def summarize_prices(complex_name, articles):
+    """거래유형 x 면적대별 매물 수와 최저/중위/최고 가격(만원) 요약 행 목록"""
+    groups = {}
+    for article in articles:
+        key = (article.get('tradeTypeName') or '-', area_band(parse_area(article.get('area2'))))
+        groups.setdefault(key, []).append(parse_price(article.get('dealOrWarrantPrc')))
+
+    band_order = {name: i for i, (_, name) in enumerate(AREA_BANDS)}
+    summary = []
+    ordered = sorted(groups.items(), key=lambda item: (item[0][0], band_order.get(item[0][1], len(band_order))))
+    for (trade, band), prices in ordered:
+        known = [price for price in prices if price is not None]
+        summary.append([
+            complex_name, trade, band, len(prices),
+            min(known) if known else '-',
+            statistics.median(known) if known else '-',
+            max(known) if known else '-',
+        ])
+    return summary
+
+
+def prepare_complex_sheet(job):
+    """단지 하나의 시트 데이터(행, 열 너비, 요약)를 준비 (프로세스 풀에서 실행)"""
+    complex_name, title, articles = job
+    rows = list(export_rows(articles))
+    widths = [len(header) for header in EXPORT_HEADERS]
+    for row in rows:
+        for col, value in enumerate(row):
+            length = len(str(value))
+            if length > widths[col]:
+                widths[col] = length
+    return {
+        'name': complex_name,
+        'title': title,
+        'rows': rows,
+        'widths': widths,
+        'summary': summarize_prices(complex_name, articles),
+    }
+
+
+_process_pool = None
+_process_pool_unavailable = False
+
+
+def get_process_pool():
+    """내보내기용 프로세스 풀 (처음 사용할 때 생성, 만들 수 없는 환경이면 None)"""
+    global _process_pool, _process_pool_unavailable
+    if _process_pool is None and not _process_pool_unavailable:
+        try:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=EXPORT_PROCESSES,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        except (OSError, ImportError, NotImplementedError) as e:
+            # Vercel 등 /dev/shm(세마포어)이 없는 환경
+            print(f"[ERROR] 내보내기 프로세스 풀 생성 실패, 현재 프로세스에서 실행합니다: {e}")
+            _process_pool_unavailable = True
+    return _process_pool
+
+
+def reset_process_pool(pool):
+    """깨진 풀(자식 프로세스 비정상 종료)을 버려 다음 호출 때 새로 만들게 함"""
+    global _process_pool
+    if _process_pool is pool:
+        _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_in_pool(task, fallback):
+    """task(pool)을 실행하고 풀이 없으면 fallback()을 실행
+
+    자식 프로세스가 죽어(OOM 등) 풀이 깨지면 새 풀로 한 번 다시 시도하고,
+    그래도 실패하면 BrokenProcessPool을 그대로 올린다 (깨진 풀은 버려서 다음 요청에 영향 없음).
+    """
+    for retry in (True, False):
+        pool = get_process_pool()
+        if pool is None:
+            return fallback()
+        try:
+            return task(pool)
+        except BrokenProcessPool as e:
+            reset_process_pool(pool)
+            if not retry:
+                raise
+            print(f"[ERROR] 내보내기 프로세스 풀이 중단되어 새 풀로 다시 시도합니다: {e}")
+
+
+def prepare_complex_sheets(jobs):
+    """단지별 시트 데이터를 프로세스 풀의 여러 자식 프로세스에서 나눠 준비 (결과는 jobs 순서)"""
+    return run_in_pool(lambda pool: list(pool.map(prepare_complex_sheet, jobs)),
+                       lambda: [prepare_complex_sheet(job) for job in jobs])
+
+
+def write_summary_sheet(workbook, formats, summary_rows):
+    ws = workbook.add_worksheet(SUMMARY_SHEET_NAME)
+    ws.set_row(0, HEADER_ROW_HEIGHT)
+    ws.write_row(0, 0, SUMMARY_HEADERS, formats['header'])
+    widths = [len(header) for header in SUMMARY_HEADERS]
+    for row_idx, row in enumerate(summary_rows, 1):
+        ws.write_row(row_idx, 0, row, formats['cell'])
+        for col, value in enumerate(row):
+            widths[col] = max(widths[col], len(str(value)))
+    for col, width in enumerate(widths):
+        ws.set_column(col, col, max(width + 4, 10))
+    ws.autofilter(0, 0, max(len(summary_rows), 1), len(SUMMARY_HEADERS) - 1)
+
+
+def write_multi_complex_workbook(output, sheets):
+    """준비된 시트(prepare_complex_sheet 결과)를 요약 시트 + 단지별 시트 워크북으로 기록 (프로세스 풀에서 실행)"""
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True, 'tmpdir': tempfile.gettempdir()})
+    try:
+        formats = create_formats(workbook)
+        write_summary_sheet(workbook, formats, [row for sheet in sheets for row in sheet['summary']])
+        used_names = [SUMMARY_SHEET_NAME]
+        for sheet in sheets:
+            name = safe_sheet_name(sheet['name'], used_names)
+            used_names.append(name)
+            write_listing_sheet(workbook, formats, name, sheet['title'], sheet['rows'], widths=sheet['widths'])
+    finally:
+        workbook.close()
+    return len(sheets)
+
+
+def build_multi_complex_workbook(output, sheets):
+    """prepare_complex_sheets로 준비한 시트를 워크북 하나로 합쳐 output(경로)에 기록
+
+    한 워크북은 나눠 쓸 수 없으므로 합치는 단계만 자식 프로세스 하나에서 실행한다.
+    """
+    return run_in_pool(lambda pool: pool.submit(write_multi_complex_workbook, output, sheets).result(),
+                       lambda: write_multi_complex_workbook(output, sheets))
+
+
+def stream_csv(rows, headers=EXPORT_HEADERS):
+    """CSV를 일정 행 단위로 인코딩해 bytes 청크로 생성
+
+    엑셀에서 한글이 깨지지 않도록 UTF-8 BOM으로 시작한다.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow(headers)
+
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % CSV_FLUSH_ROWS == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode('utf-8')
+
+
+def parquet_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ('매물번호', pa.string()),
+        ('거래유형', pa.string()),
+        ('동', pa.string()),
+        ('층', pa.int16()),
+        ('전용면적', pa.float64()),
+        ('방향', pa.string()),
+        ('거래가격', pa.int64()),   # 만원
+        ('월세', pa.int64()),       # 만원
+        ('중개사무소', pa.string()),
+        ('등록일', pa.date32()),
+        ('특징', pa.string()),
+    ])
+
+
+def write_parquet(output, rows):
+    """typed_row 형식의 행을 배치 단위로 Parquet 파일(경로 또는 파일 객체)에 기록
+
+    pyarrow가 없으면 ImportError를 그대로 올린다.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = parquet_schema()
+    with pq.ParquetWriter(output, schema, compression='snappy') as writer:
+        batch = {column: [] for column in TYPED_COLUMNS}
+        size = 0
+        for row in rows:
+            for column in TYPED_COLUMNS:
+                batch[column].append(row[column])
+            size += 1
+            if size == PARQUET_BATCH_ROWS:
+                writer.write_table(pa.table(batch, schema=schema))
+                batch = {column: [] for column in TYPED_COLUMNS}
+                size = 0
+        if size:
+            writer.write_table(pa.table(batch, schema=schema))
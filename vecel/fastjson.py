@@ -0,0 +1,73 @@
+"""빠른 JSON 직렬화 계층
+
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 동작한다.
+Flask 응답(app.json)과 네이버 API 응답 파싱에 공통으로 사용한다.
+"""
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성
+    orjson = None
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def loads(data):
+    """str/bytes JSON 역직렬화"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_response(response):
+    """requests.Response 본문을 JSON으로 파싱 (response.json() 대체)"""
+    return loads(response.content)
+
+
+def dumps_bytes(obj, default=None, sort_keys=False, indent=False):
+    """JSON 직렬화 결과를 UTF-8 bytes로 반환"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # 64비트 범위를 넘는 정수 등 orjson이 처리하지 못하는 값은 표준 json으로 처리
+            pass
+    separators = None if indent else (',', ':')
+    return json.dumps(obj, default=default, sort_keys=sort_keys, ensure_ascii=False,
+                      indent=2 if indent else None, separators=separators).encode('utf-8')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """orjson 기반 Flask JSON provider (없으면 표준 json으로 폴백)
+
+    datetime 등은 기존 DefaultJSONProvider와 같은 형식으로 직렬화된다.
+    """
+
+    ensure_ascii = False
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs.keys() - {'indent', 'separators'}:
+            kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+            return super().dumps(obj, **kwargs)
+        return dumps_bytes(obj, default=self.default, sort_keys=self.sort_keys,
+                           indent=bool(kwargs.get('indent'))).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = dumps_bytes(obj, default=self.default, sort_keys=self.sort_keys, indent=indent)
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
@@ -0,0 +1,223 @@
+"""검색 기록·매물 스냅샷 저장 (write-behind)
+
+요청 처리 스레드는 큐에 기록만 넣고 바로 응답한다. 별도 스레드가 큐를 모아
+직렬화·압축한 뒤 한 번의 커밋으로 Search / Crawl / Article 테이블에 저장한다.
+기록마다 SAVEPOINT를 두어 한 기록이 실패해도 같은 배치의 다른 기록은 저장된다.
+스냅샷을 저장할 때 같은 단지·거래유형의 직전 스냅샷과 비교해 변동(ListingChange)도 함께 기록한다.
+"""
+import queue
+import threading
+import zlib
+from datetime import datetime
+
+from fastjson import dumps_bytes, loads
+from listings import typed_row
+from models import db, Search, Crawl, Article, ListingChange
+
+try:
+    import zstandard
+except ImportError:  # zstandard는 선택 의존성
+    zstandard = None
+
+CODEC = 'zstd' if zstandard is not None else 'zlib'
+BATCH_SIZE = 50
+ARTICLE_INSERT_CHUNK = 1000
+QUEUE_SIZE = 1000
+
+CHANGE_NEW = 'new'
+CHANGE_DELISTED = 'delisted'
+CHANGE_PRICE = 'price_changed'
+
+_queue = queue.Queue(maxsize=QUEUE_SIZE)
+_writer = None
+_writer_lock = threading.Lock()
+_app = None
+
+
+def compress(data, codec=CODEC):
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def decompress(data, codec):
+    if codec == 'zstd':
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def load_results(search):
+    """Search에 저장된 결과 행 목록 복원"""
+    if search.results_blob is not None:
+        return loads(decompress(search.results_blob, search.results_codec))
+    if search.results:
+        return loads(search.results)
+    return []
+
+
+def init_app(app):
+    global _app
+    _app = app
+
+
+def _ensure_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_write_forever, name='history-writer', daemon=True)
+            _writer.start()
+
+
+def _enqueue(write):
+    """write()는 writer 스레드의 app context 안에서 실행되어 세션에 변경을 추가한다."""
+    _ensure_writer()
+    try:
+        _queue.put_nowait(write)
+    except queue.Full:
+        print("[ERROR] 기록 큐가 가득 차 기록을 건너뜁니다.")
+
+
+def record_search(user_id, complex_no, keyword, trade_type, rows):
+    """검색 결과 기록을 큐에 추가 (요청을 막지 않으며, 큐가 가득 차면 버린다)"""
+    def write():
+        db.session.add(Search(
+            user_id=user_id,
+            complex_no=str(complex_no),
+            keyword=(keyword or str(complex_no))[:200],
+            trade_type=trade_type or '전체',
+            result_count=len(rows),
+            results_codec=CODEC,
+            results_blob=compress(dumps_bytes(rows)),
+        ))
+    _enqueue(write)
+
+
+def article_record(crawl, article):
+    row = typed_row(article)
+    return {
+        'crawl_id': crawl.id,
+        'article_no': str(row['매물번호']),
+        'complex_no': crawl.complex_no,
+        'crawled_at': crawl.crawled_at,
+        'trade_type': row['거래유형'],
+        'building': row['동'],
+        'floor': row['층'],
+        'floor_info': article.get('floorInfo'),
+        'area': row['전용면적'],
+        'direction': row['방향'],
+        'price': row['거래가격'],
+        'rent': row['월세'],
+        'realtor': row['중개사무소'],
+        'confirm_date': row['등록일'],
+        'tags': row['특징'],
+    }
+
+
+def save_crawl(complex_no, trade_type, articles, crawled_at=None):
+    """매물 스냅샷을 Crawl + Article로 저장 (Article은 executemany 일괄 INSERT). 커밋은 호출자가 한다."""
+    crawl = Crawl(complex_no=str(complex_no), trade_type=trade_type or '전체',
+                  crawled_at=crawled_at or datetime.utcnow(), article_count=0)
+    db.session.add(crawl)
+    db.session.flush()
+
+    records = {}
+    for article in articles:
+        if article.get('articleNo'):
+            records[str(article['articleNo'])] = article_record(crawl, article)
+    records = list(records.values())
+    crawl.article_count = len(records)
+    for start in range(0, len(records), ARTICLE_INSERT_CHUNK):
+        db.session.execute(db.insert(Article), records[start:start + ARTICLE_INSERT_CHUNK])
+    record_changes(crawl)
+    return crawl
+
+
+def snapshot(crawl_id):
+    """수집 한 번의 매물을 {매물번호: (Article id, 가격, 월세)}로 조회"""
+    rows = (db.session.query(Article.article_no, Article.id, Article.price, Article.rent)
+            .filter(Article.crawl_id == crawl_id))
+    return {article_no: (article_id, price, rent) for article_no, article_id, price, rent in rows}
+
+
+def diff_snapshots(previous, current):
+    """두 스냅샷을 매물번호 해시 조인으로 비교 (O(n))
+
+    반환값: (변동 유형, 매물번호, 이전 값, 현재 값) 목록. 값은 snapshot()의 튜플이며
+    신규는 이전 값, 삭제는 현재 값이 None이다.
+    """
+    changes = []
+    for article_no, new in current.items():
+        old = previous.get(article_no)
+        if old is None:
+            changes.append((CHANGE_NEW, article_no, None, new))
+        elif old[1:] != new[1:]:
+            changes.append((CHANGE_PRICE, article_no, old, new))
+    for article_no, old in previous.items():
+        if article_no not in current:
+            changes.append((CHANGE_DELISTED, article_no, old, None))
+    return changes
+
+
+def record_changes(crawl):
+    """직전 스냅샷과 비교해 ListingChange 저장 (첫 수집이면 기록하지 않음). 저장한 변동 수를 반환"""
+    previous = (Crawl.query
+                .filter(Crawl.complex_no == crawl.complex_no,
+                        Crawl.trade_type == crawl.trade_type,
+                        Crawl.id != crawl.id,
+                        Crawl.crawled_at <= crawl.crawled_at)
+                .order_by(Crawl.crawled_at.desc(), Crawl.id.desc())
+                .first())
+    if previous is None:
+        return 0
+
+    records = []
+    for change_type, article_no, old, new in diff_snapshots(snapshot(previous.id), snapshot(crawl.id)):
+        records.append({
+            'crawl_id': crawl.id,
+            'previous_crawl_id': previous.id,
+            'article_id': (new or old)[0],
+            'complex_no': crawl.complex_no,
+            'trade_type': crawl.trade_type,
+            'article_no': article_no,
+            'change_type': change_type,
+            'old_price': old[1] if old else None,
+            'new_price': new[1] if new else None,
+            'old_rent': old[2] if old else None,
+            'new_rent': new[2] if new else None,
+            'detected_at': crawl.crawled_at,
+        })
+    for start in range(0, len(records), ARTICLE_INSERT_CHUNK):
+        db.session.execute(db.insert(ListingChange), records[start:start + ARTICLE_INSERT_CHUNK])
+    return len(records)
+
+
+def record_crawl(complex_no, trade_type, articles):
+    """매물 스냅샷 저장을 큐에 추가"""
+    crawled_at = datetime.utcnow()
+    _enqueue(lambda: save_crawl(complex_no, trade_type, articles, crawled_at))
+
+
+def _write_forever():
+    while True:
+        batch = [_queue.get()]
+        while len(batch) < BATCH_SIZE:
+            try:
+                batch.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        with _app.app_context():
+            try:
+                for write in batch:
+                    try:
+                        # 항목마다 SAVEPOINT: 실패한 기록만 버리고 같은 배치의 다른 기록은 저장
+                        with db.session.begin_nested():
+                            write()
+                    except Exception as e:
+                        print(f"[ERROR] 기록 저장 중 오류 (해당 기록만 제외): {str(e)}")
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                print(f"[ERROR] 기록 저장 중 오류: {str(e)}")
+            finally:
+                for _ in batch:
+                    _queue.task_done()
@@ -0,0 +1,191 @@
+"""Prometheus 메트릭 (/metrics)
+
+경로별 요청 처리 시간, 네이버 업스트림 요청(엔드포인트별 응답 시간·상태 코드), 수집 1회당 페이지 수,
+페이지 사이 대기 시간, 캐시 적중/미스, 내보내기 파일 생성 시간·크기, 진행 중인 작업 수를 기록한다.
+
+PROMETHEUS_MULTIPROC_DIR가 설정되어 있으면(gunicorn 설정 파일이 기본값을 지정, metrics_multiprocess 참고)
+워커마다 값을 그 디렉터리의 파일에 기록하고 /metrics는 모든 워커의 값을 합산해 응답한다.
+prometheus_client가 없으면 기록은 무시하고 /metrics는 501로 응답한다.
+METRICS_TOKEN을 설정하면 /metrics에 `Authorization: Bearer <토큰>` 헤더가 필요하고, 설정하지 않으면
+같은 서버(loopback)에서 프록시를 거치지 않고 직접 보낸 요청만 허용한다.
+
+캐시 적중률 예: sum by (cache) (rate(cache_requests_total{result="hit"}[5m])) / sum by (cache) (rate(cache_requests_total[5m]))
+"""
+import hmac
+import inspect
+import os
+import time
+from functools import wraps
+
+from flask import Response, g, jsonify, request
+
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+LOOPBACK_ADDRS = ('127.0.0.1', '::1')
+MULTIPROC_DIR = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+if MULTIPROC_DIR:
+    # prometheus_client는 불러올 때 이 디렉터리에 워커별 파일을 만든다
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:  # prometheus_client는 선택 의존성
+    prometheus_client = None
+
+REQUEST_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+UPSTREAM_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+PAGE_BUCKETS = (1, 2, 3, 5, 10, 20, 50)
+WAIT_BUCKETS = (0.1, 0.5, 1, 2, 5)
+EXPORT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (1e4, 1e5, 5e5, 1e6, 5e6, 1e7, 5e7, 1e8)
+
+
+class _NullMetric:
+    """prometheus_client가 없을 때 쓰는 빈 메트릭"""
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def observe(self, value):
+        pass
+
+    def inc(self, amount=1):
+        pass
+
+    def dec(self, amount=1):
+        pass
+
+
+def _metric(kind, name, documentation, labelnames=(), **kwargs):
+    if prometheus_client is None:
+        return _NullMetric()
+    return getattr(prometheus_client, kind)(name, documentation, labelnames, **kwargs)
+
+
+REQUEST_LATENCY = _metric('Histogram', 'http_request_duration_seconds', '경로별 요청 처리 시간',
+                          ('method', 'route', 'status'), buckets=REQUEST_BUCKETS)
+UPSTREAM_LATENCY = _metric('Histogram', 'naver_upstream_request_duration_seconds',
+                           '네이버 엔드포인트별 요청 시간', ('endpoint',), buckets=UPSTREAM_BUCKETS)
+UPSTREAM_RESPONSES = _metric('Counter', 'naver_upstream_responses', '네이버 엔드포인트별 응답 상태 코드 수',
+                             ('endpoint', 'status'))
+CRAWL_PAGES = _metric('Histogram', 'naver_crawl_pages', '매물 수집 1회당 조회한 목록 페이지 수',
+                      buckets=PAGE_BUCKETS)
+RATE_LIMIT_WAIT = _metric('Histogram', 'naver_rate_limit_wait_seconds', '매물 목록 페이지 사이 대기 시간',
+                          buckets=WAIT_BUCKETS)
+CACHE_REQUESTS = _metric('Counter', 'cache_requests', '캐시 조회 수 (result: hit/miss)', ('cache', 'result'))
+EXPORT_DURATION = _metric('Histogram', 'export_duration_seconds', '내보내기 파일 생성 시간', ('format',),
+                          buckets=EXPORT_BUCKETS)
+EXPORT_BYTES = _metric('Histogram', 'export_size_bytes', '내보내기 파일 크기', ('format',), buckets=SIZE_BUCKETS)
+# livesum: 살아 있는 워커의 값만 합산 (종료된 워커의 값은 gunicorn child_exit 훅에서 정리)
+IN_FLIGHT = _metric('Gauge', 'jobs_in_flight', '진행 중인 수집·내보내기 작업 수', ('kind',),
+                    multiprocess_mode='livesum')
+
+
+def observe_upstream(endpoint, status, seconds):
+    """네이버 요청 1건 기록 (status: HTTP 상태 코드, 연결 오류·시간 초과는 'error')"""
+    UPSTREAM_LATENCY.labels(endpoint).observe(seconds)
+    UPSTREAM_RESPONSES.labels(endpoint, str(status)).inc()
+
+
+def observe_crawl_pages(pages):
+    CRAWL_PAGES.observe(pages)
+
+
+def observe_rate_limit_wait(seconds):
+    RATE_LIMIT_WAIT.observe(seconds)
+
+
+def cache_lookup(cache, hit):
+    CACHE_REQUESTS.labels(cache, 'hit' if hit else 'miss').inc()
+
+
+def observe_export(export_format, seconds, size):
+    EXPORT_DURATION.labels(export_format).observe(seconds)
+    EXPORT_BYTES.labels(export_format).observe(size)
+
+
+def track_export_stream(export_format, chunks):
+    """스트리밍 내보내기(CSV)의 전송 완료까지 걸린 시간과 크기를 기록하며 chunks를 그대로 전달"""
+    start = time.perf_counter()
+    size = 0
+    for chunk in chunks:
+        size += len(chunk)
+        yield chunk
+    observe_export(export_format, time.perf_counter() - start, size)
+
+
+def job_started(kind):
+    IN_FLIGHT.labels(kind).inc()
+
+
+def job_finished(kind):
+    IN_FLIGHT.labels(kind).dec()
+
+
+def track_in_flight(kind):
+    """함수가 실행되는 동안 jobs_in_flight{kind}를 1 늘리는 데코레이터 (async 함수도 가능)"""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                job_started(kind)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    job_finished(kind)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            job_started(kind)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                job_finished(kind)
+        return wrapper
+    return decorator
+
+
+def render():
+    """노출 형식의 메트릭 본문 (multiprocess 모드면 모든 워커의 값을 합산)"""
+    if MULTIPROC_DIR:
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry)
+
+
+def authorized():
+    if not METRICS_TOKEN:
+        # 같은 호스트의 리버스 프록시를 거친 외부 요청은 X-Forwarded-For가 붙으므로 제외
+        return request.remote_addr in LOOPBACK_ADDRS and 'X-Forwarded-For' not in request.headers
+    return hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {METRICS_TOKEN}')
+
+
+def init_app(app):
+    """app에 요청 처리 시간 기록 훅과 /metrics 경로 등록"""
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_latency(response):
+        started = g.pop('request_started', None)
+        if started is not None:
+            # 경로 규칙(예: /exports/<job_id>)으로 묶어 라벨 수를 제한
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            REQUEST_LATENCY.labels(request.method, route, str(response.status_code)).observe(
+                time.perf_counter() - started)
+        return response
+
+    @app.route('/metrics')
+    def metrics():
+        if prometheus_client is None:
+            return jsonify({'error': '메트릭을 사용할 수 없습니다. (prometheus_client 미설치)'}), 501
+        if not authorized():
+            if not METRICS_TOKEN:
+                return jsonify({'error': '접근 권한이 없습니다. (METRICS_TOKEN을 설정하세요)'}), 403
+            return jsonify({'error': '인증이 필요합니다.'}), 401
+        return Response(render(), content_type=prometheus_client.CONTENT_TYPE_LATEST)
@@ -0,0 +1,67 @@
+"""스키마 마이그레이션 (추가 전용)
+
+models.py의 정의와 실제 데이터베이스를 비교해 없는 테이블·컬럼·인덱스만 추가한다.
+기존 테이블이나 데이터는 삭제·변경하지 않으므로 운영 중인 데이터베이스에서도
+서버 시작 전에 여러 번 실행해도 안전하다.
+
+    python migrations.py    # 마이그레이션 + 관리자 계정 확인
+"""
+from sqlalchemy import inspect, text
+
+from models import db
+
+
+def missing_columns(inspector, table):
+    existing = {column['name'] for column in inspector.get_columns(table.name)}
+    return [column for column in table.columns if column.name not in existing]
+
+
+def add_column(connection, table, column):
+    """ALTER TABLE ... ADD COLUMN
+
+    server_default가 있으면 기존 행에도 그 값이 채워진다. NOT NULL/기본 키 제약은
+    기존 행 때문에 걸지 않는다.
+    """
+    dialect = connection.dialect
+    column_type = column.type.compile(dialect=dialect)
+    preparer = dialect.identifier_preparer
+    ddl = f'ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} {column_type}'
+    default = dialect.ddl_compiler(dialect, None).get_column_default_string(column)
+    if default is not None:
+        ddl += f' DEFAULT {default}'
+    connection.execute(text(ddl))
+
+
+def upgrade(engine=None):
+    """없는 테이블·컬럼·인덱스를 추가하고 적용한 변경 목록을 반환"""
+    engine = engine or db.engine
+    applied = []
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        existing_tables = set(inspector.get_table_names())
+
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                table.create(connection)  # 인덱스 포함
+                applied.append(f'create table {table.name}')
+                continue
+
+            for column in missing_columns(inspector, table):
+                add_column(connection, table, column)
+                applied.append(f'add column {table.name}.{column.name}')
+
+            existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(connection)
+                    applied.append(f'create index {index.name}')
+
+    for change in applied:
+        print(f"[DEBUG] 마이그레이션: {change}")
+    return applied
+
+
+if __name__ == '__main__':
+    from app import init_db
+
+    init_db()